@@ -1,11 +1,72 @@
 #!/usr/bin/env python3
 import argparse
+import hashlib
+import json
+import os
 import sys
 from pathlib import Path
 
-from python.json_formatter import format_file
+try:
+    import fcntl
+except ImportError:  # Windows: saves are still atomic, just not serialized
+    fcntl = None
 
-def main():
+def _cache_home() -> Path:
+    """User cache directory, honouring XDG_CACHE_HOME when it is an absolute path."""
+    cache_home = os.environ.get('XDG_CACHE_HOME', '')
+    if os.path.isabs(cache_home):
+        return Path(cache_home)
+    return Path.home() / '.cache'
+
+# Files that passed --check, keyed by path, size and mtime
+CHECK_CACHE_FILE = _cache_home() / 'obdb-fmt' / 'check-cache.json'
+
+# Sources whose behaviour determines whether a file passes --check
+FORMATTER_SOURCES = [
+    Path(__file__).parent / 'python' / 'json_formatter.py',
+    Path(__file__).parent / 'python' / 'overlapping_signals.py',
+]
+
+def _formatter_fingerprint() -> str:
+    """Hash the formatter sources so cached results are dropped when they change."""
+    digest = hashlib.sha256()
+    for source in FORMATTER_SOURCES:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+def _load_check_cache(fingerprint: str) -> dict:
+    """Load cached --check passes, ignoring the cache if it is unreadable or stale."""
+    try:
+        with open(CHECK_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('formatter') != fingerprint:
+        return {}
+    return cache.get('files', {})
+
+def _save_check_cache(fingerprint: str, cache_key: str, cache_entry: list) -> None:
+    """Record one --check pass; failures only cost a cache miss.
+
+    The cache is re-read under a lock and replaced atomically, so concurrent
+    runs neither drop each other's entries nor leave a truncated file.
+    """
+    try:
+        CHECK_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CHECK_CACHE_FILE.with_name(f"{CHECK_CACHE_FILE.name}.lock"), 'w') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            files = _load_check_cache(fingerprint)
+            files[cache_key] = cache_entry
+            tmp_file = CHECK_CACHE_FILE.with_name(f"{CHECK_CACHE_FILE.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump({'formatter': fingerprint, 'files': files}, f)
+            os.replace(tmp_file, CHECK_CACHE_FILE)
+    except OSError:
+        pass
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for the formatter."""
     parser = argparse.ArgumentParser(
         description='Format signal set JSON files in a compact, column-aligned way'
     )
@@ -25,62 +86,93 @@ def main():
         action='store_true',
         help='Check if file is properly formatted without modifying it'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='With --check, ignore and do not update the cache of files that already passed'
+    )
+    return parser
 
-    args = parser.parse_args()
+def _print_overlaps(overlaps) -> None:
+    """Report overlapping signals on stderr."""
+    for err in overlaps:
+        print(
+            f"✗ Signal '{err.signal_id}' overlaps with '{err.conflicting_signal_id}' "
+            f"at bit {err.bit} in command [{err.command}]",
+            file=sys.stderr
+        )
 
+def run(args: argparse.Namespace) -> int:
+    """Format or check the requested file and return the process exit status."""
     # Verify input file exists
     input_path = Path(args.input_file)
     if not input_path.exists():
         print(f"Error: Input file '{args.input_file}' does not exist", file=sys.stderr)
-        sys.exit(1)
+        return 1
+
+    # Imported here so --help and usage errors don't pay for loading the formatter
+    from python.json_formatter import format_string, is_canonical
 
     try:
         if args.check:
-            # Read current file content
-            with open(input_path, 'r') as f:
-                current_content = f.read()
+            # Read current file content once, as raw bytes so it is neither
+            # decoded nor re-encoded for hashing
+            current_content = input_path.read_bytes()
+
+            # Skip parsing entirely if this exact file already passed
+            if not args.no_cache:
+                fingerprint = _formatter_fingerprint()
+                cached_files = _load_check_cache(fingerprint)
+                stat = input_path.stat()
+                cache_key = str(input_path.resolve())
+                cache_entry = [stat.st_size, stat.st_mtime_ns,
+                               hashlib.sha256(current_content).hexdigest()]
+                if cached_files.get(cache_key) == cache_entry:
+                    print(f"✓ {args.input_file} is properly formatted")
+                    return 0
 
-            # Get formatted content (with overlap checking)
-            formatted_content, overlaps = format_file(str(input_path), return_overlaps=True)
+            # Compare it against the formatter output as it is produced (with overlap checking)
+            canonical, overlaps = is_canonical(current_content, return_overlaps=True)
 
-            # Compare and exit with appropriate status
-            if current_content.strip() == formatted_content.strip():
+            # Exit with appropriate status
+            if canonical:
                 print(f"✓ {args.input_file} is properly formatted")
             else:
                 print(f"✗ {args.input_file} needs reformatting", file=sys.stderr)
-                sys.exit(1)
+                return 1
 
             # Report overlapping signals as error
             if overlaps:
-                for err in overlaps:
-                    print(
-                        f"✗ Signal '{err['signal_id']}' overlaps with '{err['conflicting_signal_id']}' "
-                        f"at bit {err['bit']} in command [{err['command']}]",
-                        file=sys.stderr
-                    )
-                sys.exit(1)
+                _print_overlaps(overlaps)
+                return 1
+
+            # Remember the pass so the next check of this file is a stat and a hash
+            if not args.no_cache:
+                _save_check_cache(fingerprint, cache_key, cache_entry)
         else:
             # Format the file (with overlap checking, write first then check)
-            formatted_content, overlaps = format_file(args.input_file, args.output, return_overlaps=True)
+            formatted_content, overlaps = format_string(input_path.read_text(), return_overlaps=True)
 
             if args.output:
+                with open(args.output, 'w') as f:
+                    f.write(formatted_content)
                 print(f"Formatted {args.input_file} -> {args.output}")
             else:
                 print(formatted_content)
 
             # Report overlapping signals as error after writing
             if overlaps:
-                for err in overlaps:
-                    print(
-                        f"✗ Signal '{err['signal_id']}' overlaps with '{err['conflicting_signal_id']}' "
-                        f"at bit {err['bit']} in command [{err['command']}]",
-                        file=sys.stderr
-                    )
-                sys.exit(1)
+                _print_overlaps(overlaps)
+                return 1
 
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
-        sys.exit(1)
+        return 1
+
+    return 0
+
+def main():
+    sys.exit(run(build_parser().parse_args()))
 
 if __name__ == '__main__':
     main()
@@ -1,7 +1,13 @@
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Dict, List, Optional, Tuple, Iterator
-import re
+from sys import intern
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Iterator
+
+# Translation table that deletes ASCII whitespace from frame lines
+_WS_TABLE = str.maketrans('', '', ' \t\n\r\x0b\x0c')
+
+# Hex digit -> nibble value, used for the single-nibble ISO-TP header fields
+_HEX_NIBBLE = {c: int(c, 16) for c in '0123456789abcdefABCDEF'}
 
 class CANFramePart(Enum):
     """Identifies different segments of a CAN frame for error reporting."""
@@ -32,6 +38,44 @@ class CANIDFormat(Enum):
     ELEVEN_BIT = auto()
     TWENTY_NINE_BIT = auto()
 
+# Identifier width in hex chars per CAN ID format
+_ID_HEX_WIDTH = {
+    CANIDFormat.ELEVEN_BIT: 3,
+    CANIDFormat.TWENTY_NINE_BIT: 8,
+}
+
+def _make_prefix_parser(id_width: int, extended_addressing: bool) -> Callable[[str], Tuple[str, Optional[str], int]]:
+    """
+    Builds a parser for the part of a frame line ahead of the ISO-TP type,
+    specialised for one identifier width and addressing mode so the per-frame
+    path has no format or addressing branches. The parser returns
+    (identifier, extended receive address, index after the prefix). Identifiers
+    are interned so the frames and packets from one ECU share a single string.
+    """
+    if extended_addressing:
+        prefix_width = id_width + 2
+
+        def parse_prefix(line: str) -> Tuple[str, Optional[str], int]:
+            if len(line) < prefix_width:
+                if len(line) < id_width:
+                    raise CANFrameError("Malformed CAN identifier", line, CANFramePart.IDENTIFIER)
+                raise CANFrameError("Malformed extended receive address", line, CANFramePart.EXTENDED_RECEIVE_ADDRESS)
+            return intern(line[:id_width]), line[id_width:prefix_width], prefix_width
+    else:
+        def parse_prefix(line: str) -> Tuple[str, Optional[str], int]:
+            if len(line) < id_width:
+                raise CANFrameError("Malformed CAN identifier", line, CANFramePart.IDENTIFIER)
+            return intern(line[:id_width]), None, id_width
+
+    return parse_prefix
+
+# Prefix parser per (CAN ID format, extended addressing), resolved once per batch of frames
+_PREFIX_PARSERS = {
+    (can_id_format, extended_addressing): _make_prefix_parser(id_width, extended_addressing)
+    for can_id_format, id_width in _ID_HEX_WIDTH.items()
+    for extended_addressing in (False, True)
+}
+
 class DataFrameType(Enum):
     """
     ISO-TP frame types used for segmented message transfer:
@@ -48,12 +92,15 @@ class DataFrameType(Enum):
     @classmethod
     def from_byte(cls, byte: int) -> 'DataFrameType':
         """Converts raw frame type byte to enum, handling invalid types."""
-        try:
-            return cls(byte)
-        except ValueError:
+        data_frame_type = _DATA_FRAME_TYPES.get(byte)
+        if data_frame_type is None:
             raise CANFrameError(f"Invalid data frame type: {byte:02X}")
+        return data_frame_type
+
+# Raw frame type byte -> DataFrameType, avoiding the Enum call machinery per frame
+_DATA_FRAME_TYPES = {member.value: member for member in DataFrameType}
 
-@dataclass
+@dataclass(slots=True)
 class DataFrameHeader:
     """
     ISO-TP frame header information. Contains either:
@@ -69,7 +116,18 @@ class DataFrameHeader:
     type: Type
     value: Optional[int] = None  # Size or sequence number
 
-@dataclass
+# Enum members bound once for the per-frame parsing and reassembly loops
+_SINGLE_FRAME = DataFrameType.SINGLE_FRAME
+_FIRST_FRAME = DataFrameType.FIRST_FRAME
+_CONSECUTIVE_FRAME = DataFrameType.CONSECUTIVE_FRAME
+_FLOW_CONTROL_FRAME = DataFrameType.FLOW_CONTROL_FRAME
+
+_HEADER_SINGLE = DataFrameHeader.Type.SINGLE
+_HEADER_FIRST = DataFrameHeader.Type.FIRST
+_HEADER_CONSECUTIVE = DataFrameHeader.Type.CONSECUTIVE
+_HEADER_FLOW = DataFrameHeader.Type.FLOW
+
+@dataclass(slots=True)
 class CANFrame:
     """Represents a single CAN frame with ISO-TP transport layer information."""
     can_id_format: CANIDFormat
@@ -87,14 +145,8 @@ class CANFrame:
 
         11-bit IDs use 3 hex chars, 29-bit use 8 hex chars.
         """
-        if can_id_format == CANIDFormat.ELEVEN_BIT:
-            if len(line) < 3:
-                raise CANFrameError("Malformed CAN identifier", line, CANFramePart.IDENTIFIER)
-            return line[:3], 3
-        elif can_id_format == CANIDFormat.TWENTY_NINE_BIT:
-            if len(line) < 8:
-                raise CANFrameError("Malformed CAN identifier", line, CANFramePart.IDENTIFIER)
-            return line[:8], 8
+        can_identifier, _, index = _PREFIX_PARSERS[(can_id_format, False)](line)
+        return can_identifier, index
 
     @classmethod
     def from_line(cls, line: str, can_id_format: CANIDFormat, extended_addressing_enabled: bool = False) -> 'CANFrame':
@@ -105,86 +157,131 @@ class CANFrame:
         - Optional extended addressing
         """
         # Remove any whitespace
-        line = re.sub(r'\s+', '', line)
+        line = line.translate(_WS_TABLE)
 
-        # Parse CAN identifier
-        can_identifier, index = cls.parse_can_identifier(line, can_id_format)
+        parse_prefix = _PREFIX_PARSERS[(can_id_format, extended_addressing_enabled is True)]
+        can_identifier, extended_receive_address, index = parse_prefix(line)
+        try:
+            raw = bytes.fromhex(line[index:])
+        except ValueError:
+            # Flow control frames (payload starts mid-byte) or malformed input
+            raw = None
+        data_frame_type, data_frame_header, data = cls._parse_body(
+            line, parse_prefix, raw, 0, len(raw) if raw is not None else 0)
+
+        return cls(
+            can_id_format=can_id_format,
+            can_identifier=can_identifier,
+            extended_receive_address=extended_receive_address,
+            data_frame_type=data_frame_type,
+            data_frame_header=data_frame_header,
+            data=data
+        )
 
-        # Parse extended addressing or type
-        extended_receive_address = None
+    @classmethod
+    def _parse_body(cls, line: str, parse_prefix: Callable[[str], Tuple[str, Optional[str], int]],
+                    raw: Optional[bytes], start: int, end: int
+                    ) -> Tuple[DataFrameType, DataFrameHeader, bytes]:
+        """
+        Parses the ISO-TP header and payload of a whitespace-free frame line.
+        When the hex after the line's prefix has been decoded into raw[start:end],
+        the header fields are read straight from those bytes. Otherwise, or when
+        they don't hold a complete single, first or consecutive frame, the line
+        is parsed field by field, which handles flow control frames and reports
+        exactly which part of a malformed line is wrong.
+        Returns (frame type, header, payload).
+        """
+        if raw is not None and end > start:
+            pci = raw[start]
+            data_frame_type = _DATA_FRAME_TYPES.get(pci >> 4)
+            if data_frame_type is _SINGLE_FRAME:
+                if end > start + 1:
+                    return data_frame_type, DataFrameHeader(_HEADER_SINGLE, pci & 0x0F), raw[start + 1:end]
+            elif data_frame_type is _FIRST_FRAME:
+                if end > start + 2:
+                    size = ((pci & 0x0F) << 8) | raw[start + 1]
+                    return data_frame_type, DataFrameHeader(_HEADER_FIRST, size), raw[start + 2:end]
+            elif data_frame_type is _CONSECUTIVE_FRAME:
+                if end > start + 1:
+                    return data_frame_type, DataFrameHeader(_HEADER_CONSECUTIVE, pci & 0x0F), raw[start + 1:end]
+
+        _, _, data_frame_type, data_frame_header, index = cls._parse_header(line, parse_prefix)
+        data_string = cls._payload_hex(line, index)
+        try:
+            data = bytes.fromhex(data_string)
+        except ValueError:
+            raise CANFrameError("Invalid hex data", line, CANFramePart.DATA)
+        return data_frame_type, data_frame_header, data
 
-        if extended_addressing_enabled is True:
-            if len(line) < index + 2:
-                raise CANFrameError("Malformed extended receive address", line, CANFramePart.EXTENDED_RECEIVE_ADDRESS)
-            extended_receive_address = line[index:index + 2]
-            index += 2
+    @classmethod
+    def _parse_header(cls, line: str, parse_prefix: Callable[[str], Tuple[str, Optional[str], int]]
+                      ) -> Tuple[str, Optional[str], DataFrameType, DataFrameHeader, int]:
+        """
+        Parses everything ahead of the payload in a whitespace-free frame line,
+        using the prefix parser already selected for the CAN ID format and
+        addressing mode.
+        Returns (identifier, extended address, frame type, header, payload index).
+        """
+        # Parse CAN identifier and extended addressing
+        can_identifier, extended_receive_address, index = parse_prefix(line)
 
         # Parse type
         if len(line) < index + 1:
             raise CANFrameError("Malformed type", line, CANFramePart.TYPE)
-        try:
-            byte = int(line[index], 16)
-            data_frame_type = DataFrameType.from_byte(byte)
-            index += 1
-        except ValueError:
+        byte = _HEX_NIBBLE.get(line[index])
+        if byte is None:
             raise CANFrameError(f"Invalid character: {line[index]}")
+        data_frame_type = DataFrameType.from_byte(byte)
+        index += 1
 
         # Parse frame header based on type
         data_frame_header = None
-        if data_frame_type == DataFrameType.SINGLE_FRAME:
+        if data_frame_type is _SINGLE_FRAME:
             if len(line) < index + 1:
                 raise CANFrameError("Malformed size", line, CANFramePart.SIZE)
-            try:
-                size = int(line[index], 16)
-                data_frame_header = DataFrameHeader(DataFrameHeader.Type.SINGLE, size)
-                index += 1
-            except ValueError:
+            size = _HEX_NIBBLE.get(line[index])
+            if size is None:
                 raise CANFrameError("Invalid size")
+            data_frame_header = DataFrameHeader(_HEADER_SINGLE, size)
+            index += 1
 
-        elif data_frame_type == DataFrameType.FIRST_FRAME:
+        elif data_frame_type is _FIRST_FRAME:
             if len(line) < index + 3:
                 raise CANFrameError("Malformed size", line, CANFramePart.SIZE)
+            # The type nibble and 12-bit size form two whole bytes
             try:
-                size = int(line[index:index + 3], 16)
-                data_frame_header = DataFrameHeader(DataFrameHeader.Type.FIRST, size)
-                index += 3
+                pci = bytes.fromhex(line[index - 1:index + 3])
             except ValueError:
                 raise CANFrameError("Invalid size")
+            size = ((pci[0] & 0x0F) << 8) | pci[1]
+            data_frame_header = DataFrameHeader(_HEADER_FIRST, size)
+            index += 3
 
-        elif data_frame_type == DataFrameType.CONSECUTIVE_FRAME:
+        elif data_frame_type is _CONSECUTIVE_FRAME:
             if len(line) < index + 1:
                 raise CANFrameError("Malformed index", line, CANFramePart.INDEX)
-            try:
-                frame_index = int(line[index], 16)
-                data_frame_header = DataFrameHeader(DataFrameHeader.Type.CONSECUTIVE, frame_index)
-                index += 1
-            except ValueError:
+            frame_index = _HEX_NIBBLE.get(line[index])
+            if frame_index is None:
                 raise CANFrameError("Invalid frame index")
+            data_frame_header = DataFrameHeader(_HEADER_CONSECUTIVE, frame_index)
+            index += 1
+
+        elif data_frame_type is _FLOW_CONTROL_FRAME:
+            data_frame_header = DataFrameHeader(_HEADER_FLOW)
 
-        elif data_frame_type == DataFrameType.FLOW_CONTROL_FRAME:
-            data_frame_header = DataFrameHeader(DataFrameHeader.Type.FLOW)
+        return can_identifier, extended_receive_address, data_frame_type, data_frame_header, index
 
-        # Parse remaining data
+    @staticmethod
+    def _payload_hex(line: str, index: int) -> str:
+        """Returns the payload hex digits of a frame line, checking their length."""
         if len(line) <= index:
             raise CANFrameError("Malformed data", line, CANFramePart.DATA)
         data_string = line[index:]
         if len(data_string) % 2 != 0:
             raise CANFrameError("Malformed data (odd length)", line, CANFramePart.DATA)
-        try:
-            data = bytes.fromhex(data_string)
-        except ValueError:
-            raise CANFrameError("Invalid hex data", line, CANFramePart.DATA)
-
-        return cls(
-            can_id_format=can_id_format,
-            can_identifier=can_identifier,
-            extended_receive_address=extended_receive_address,
-            data_frame_type=data_frame_type,
-            data_frame_header=data_frame_header,
-            data=data
-        )
+        return data_string
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CANPacket:
     """
     Complete ISO-TP message reassembled from one or more CAN frames.
@@ -201,36 +298,36 @@ class CANFrameScanner:
     """
     def __init__(self, frames: List[CANFrame]):
         self.frames = frames
-        self._partial_packets: Dict[str, Tuple[bytes, int]] = {}  # CAN ID -> (accumulated data, total size)
+        self._partial_packets: Dict[str, list] = {}  # CAN ID -> [packet buffer, bytes filled, total size]
         self._frame_index = 0
 
     @classmethod
     def from_ascii_string(cls, ascii_string: str,
                          can_id_format: CANIDFormat = CANIDFormat.ELEVEN_BIT,
-                         extended_addressing_enabled: Optional[bool] = None) -> Optional['CANFrameScanner']:
+                         extended_addressing_enabled: Optional[bool] = None) -> 'CANFrameScanner':
         """
         Creates a scanner from ASCII hex dump of CAN frames.
         Handles both single-line and multi-line inputs.
         """
-        lines = cls._format_ascii_string(ascii_string)
-        if not lines:
-            return None
-
-        frames = []
-        for line in lines:
-            try:
-                frame = CANFrame.from_line(line, can_id_format, extended_addressing_enabled)
-                frames.append(frame)
-            except CANFrameError as e:
-                print(f"Error parsing frame: {e}")
-                continue
+        return cls.from_ascii_lines_bulk(cls._iter_lines(ascii_string), can_id_format, extended_addressing_enabled)
 
-        return cls(frames)
+    @classmethod
+    def from_ascii_lines_bulk(cls, lines: Iterable[str],
+                              can_id_format: CANIDFormat = CANIDFormat.ELEVEN_BIT,
+                              extended_addressing_enabled: Optional[bool] = None) -> 'CANFrameScanner':
+        """
+        Creates a scanner from individual frame lines, parsed in bulk by
+        CANFrameBatch. Malformed lines are reported and skipped.
+        """
+        return cls(CANFrameBatch.from_lines(lines, can_id_format, extended_addressing_enabled).frames())
 
     @staticmethod
-    def _format_ascii_string(ascii_string: str) -> Optional[List[str]]:
-        """Splits and cleans up raw ASCII input into frame strings."""
-        return [line.strip() for line in ascii_string.split('\n')]
+    def _iter_lines(ascii_string: str) -> Iterator[str]:
+        """Lazily splits raw ASCII input into stripped, non-empty frame strings."""
+        for line in ascii_string.splitlines():
+            line = line.strip()
+            if line:
+                yield line
 
     def __iter__(self) -> Iterator[CANPacket]:
         return self
@@ -245,36 +342,137 @@ class CANFrameScanner:
             self._frame_index += 1
 
             can_id = frame.can_identifier
+            header_type = frame.data_frame_header.type
 
-            if frame.data_frame_header.type == DataFrameHeader.Type.SINGLE:
+            if header_type is _HEADER_SINGLE:
                 return CANPacket(
                     can_identifier=can_id,
                     extended_receive_address=frame.extended_receive_address,
                     data=frame.data
                 )
 
-            elif frame.data_frame_header.type == DataFrameHeader.Type.FIRST:
-                self._partial_packets[can_id] = (frame.data, frame.data_frame_header.value)
+            elif header_type is _HEADER_FIRST:
+                # Preallocate the whole packet using the size announced by the first frame
+                packet_size = frame.data_frame_header.value
+                buffer = bytearray(packet_size)
+                filled = min(len(frame.data), packet_size)
+                buffer[:filled] = frame.data[:filled]
+                self._partial_packets[can_id] = [buffer, filled, packet_size]
 
-            elif frame.data_frame_header.type == DataFrameHeader.Type.CONSECUTIVE:
+            elif header_type is _HEADER_CONSECUTIVE:
                 if can_id not in self._partial_packets:
                     continue
 
-                accumulator, packet_size = self._partial_packets[can_id]
-                accumulator += frame.data
+                state = self._partial_packets[can_id]
+                buffer, filled, packet_size = state
+                count = min(len(frame.data), packet_size - filled)
+                buffer[filled:filled + count] = frame.data[:count]
+                state[1] = filled + count
 
-                if len(accumulator) >= packet_size:
-                    data = accumulator[:packet_size]
+                if state[1] >= packet_size:
                     del self._partial_packets[can_id]
                     return CANPacket(
                         can_identifier=can_id,
                         extended_receive_address=frame.extended_receive_address,
-                        data=data
+                        data=bytes(buffer)
                     )
-                else:
-                    self._partial_packets[can_id] = (accumulator, packet_size)
 
-            elif frame.data_frame_header.type == DataFrameHeader.Type.FLOW:
+            elif header_type is _HEADER_FLOW:
                 continue  # Flow control frames not needed for reassembly
 
         raise StopIteration
+
+class CANFrameBatch:
+    """
+    Struct-of-arrays container for bulk scans over many CAN frames.
+    Each frame field is stored column-wise, so scans over one field (e.g.
+    selecting the frames from one ECU) don't touch the others.
+    """
+    def __init__(self, can_id_format: CANIDFormat):
+        self.can_id_format = can_id_format
+        self.can_identifiers: List[str] = []
+        self.extended_receive_addresses: List[Optional[str]] = []
+        self.data_frame_types: List[DataFrameType] = []
+        self.data_frame_headers: List[DataFrameHeader] = []
+        self.payloads: List[bytes] = []
+
+    @classmethod
+    def from_ascii_string(cls, ascii_string: str,
+                          can_id_format: CANIDFormat = CANIDFormat.ELEVEN_BIT,
+                          extended_addressing_enabled: Optional[bool] = None) -> 'CANFrameBatch':
+        """Parses an ASCII hex dump of CAN frames into a batch."""
+        return cls.from_lines(CANFrameScanner._iter_lines(ascii_string), can_id_format, extended_addressing_enabled)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str],
+                   can_id_format: CANIDFormat = CANIDFormat.ELEVEN_BIT,
+                   extended_addressing_enabled: Optional[bool] = None) -> 'CANFrameBatch':
+        """
+        Parses individual frame lines into a batch. The hex after every line's
+        prefix is decoded with a single bytes.fromhex call, and each frame's
+        ISO-TP header and data are read from the shared buffer. Flow control
+        frames, whose payload starts mid-byte, are parsed field by field.
+        Malformed lines are reported and skipped.
+        """
+        batch = cls(can_id_format)
+        parse_prefix = _PREFIX_PARSERS[(can_id_format, extended_addressing_enabled is True)]
+        prefixed = []
+        bodies = []
+        for line in lines:
+            line = line.translate(_WS_TABLE)
+            try:
+                prefix = parse_prefix(line)
+            except CANFrameError as e:
+                # Reported in line order below
+                prefixed.append((line, e))
+                bodies.append('')
+                continue
+            prefixed.append((line, prefix))
+            bodies.append(line[prefix[2]:])
+
+        try:
+            # Odd-length bodies (flow control or malformed) would misalign the rest
+            buffer = bytes.fromhex(''.join(body for body in bodies if not len(body) % 2))
+        except ValueError:
+            # At least one frame has invalid hex; parse every frame on its own so only bad frames are dropped
+            buffer = None
+
+        offset = 0
+        for (line, prefix), body in zip(prefixed, bodies):
+            if isinstance(prefix, CANFrameError):
+                print(f"Error parsing frame: {prefix}")
+                continue
+            start = offset
+            if buffer is not None and not len(body) % 2:
+                offset += len(body) // 2
+            try:
+                data_frame_type, data_frame_header, data = CANFrame._parse_body(
+                    line, parse_prefix, buffer, start, offset)
+            except CANFrameError as e:
+                print(f"Error parsing frame: {e}")
+                continue
+            batch.can_identifiers.append(prefix[0])
+            batch.extended_receive_addresses.append(prefix[1])
+            batch.data_frame_types.append(data_frame_type)
+            batch.data_frame_headers.append(data_frame_header)
+            batch.payloads.append(data)
+
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.can_identifiers)
+
+    def frames(self) -> List[CANFrame]:
+        """Returns the batch as one CANFrame per frame, in input order."""
+        can_id_format = self.can_id_format
+        return [
+            CANFrame(can_id_format, can_identifier, extended_receive_address,
+                     data_frame_type, data_frame_header, data)
+            for can_identifier, extended_receive_address, data_frame_type, data_frame_header, data in zip(
+                self.can_identifiers, self.extended_receive_addresses,
+                self.data_frame_types, self.data_frame_headers, self.payloads)
+        ]
+
+    def select_by_id(self, can_identifier: str) -> List[int]:
+        """Returns the indices of all frames sent with the given CAN identifier."""
+        return [i for i, frame_id in enumerate(self.can_identifiers) if frame_id == can_identifier]
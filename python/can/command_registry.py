@@ -1,44 +1,72 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from enum import Enum
+from itertools import chain
+import logging
 import os
-import json
+import pickle
+import sys
 import time
+import urllib.error
 import urllib.request
+import weakref
 from pathlib import Path
 
 from signalsets.loader import get_signalset_from_model_year
 
 from .can_frame import CANPacket, CANFrameScanner, CANIDFormat
-from .signals import Command, Enumeration, Scaling, SignalSet, Filter
+from .signals import Command, Enumeration, Scaling, SignalSet, Filter, ParameterType, json_loads
 from .repo_utils import extract_make_from_repo_name
 
+logger = logging.getLogger(__name__)
+
 # Cache directory for downloaded signal definitions
 CACHE_DIR = Path(__file__).parent / ".cache"
 SAEJ1979_URL = "https://raw.githubusercontent.com/OBDb/SAEJ1979/refs/heads/main/signalsets/v3/default.json"
 NISSANINFINITI_URL = "https://raw.githubusercontent.com/OBDb/NissanInfiniti/refs/heads/main/signalsets/v3/default.json"
 
+# Module defining the classes stored in pickled signal definitions
+SIGNALS_SOURCE = Path(__file__).parent / "signals.py"
+
+# Seconds before cached signal definitions are fetched again
+CACHE_MAX_AGE = 86400
+
+# Parsed signal definitions by (cache name, signal type), with the time they were loaded
+SIGNALSET_MEMORY_CACHE: Dict[Tuple[str, str], Tuple[float, List['Command']]] = {}
+
 # Global registry cache by model year
 MODEL_YEAR_REGISTRY_CACHE: Dict[int, 'CommandRegistry'] = {}
 
-def _make_signalset_generic(json_data: str, header_override: str) -> str:
-    """Remove 'rax' fields and enable agnostic protocol magtching on each command in the signalset."""
-    data = json.loads(json_data)
+# Registries built by decode_obd_response, keyed by id() of the signal set, with
+# a weak reference to the signal set and the SAE J1979 commands they include.
+# Entries are dropped when their signal set is garbage collected.
+_REGISTRY_BY_SIGNALSET: Dict[int, Tuple['weakref.ref[SignalSet]', List['Command'], 'CommandRegistry']] = {}
+
+def _make_signalset_generic(data: Dict, header_override: str) -> Dict:
+    """Remove 'rax' fields and enable agnostic protocol magtching on each command in the signalset.
+
+    The parsed signalset is modified in place and returned.
+    """
     for command in data.get('commands', []):
         command.pop('rax', None)
         command['hdr'] = header_override
-    return json.dumps(data)
+    return data
 
-def _load_standard_commands(json_data: str) -> List['Command']:
+def _load_standard_commands(json_data: Union[str, bytes]) -> List['Command']:
+    # Parse once; each pass below only rewrites the header of every command
+    data = json_loads(json_data)
     return (
-        SignalSet.from_json(_make_signalset_generic(json_data, header_override='7E0')).commands
-        .union(SignalSet.from_json(_make_signalset_generic(json_data, header_override='DB33')).commands)
-        .union(SignalSet.from_json(_make_signalset_generic(json_data, header_override='686A')).commands)
+        SignalSet.from_dict(_make_signalset_generic(data, header_override='7E0')).commands
+        .union(SignalSet.from_dict(_make_signalset_generic(data, header_override='DB33')).commands)
+        .union(SignalSet.from_dict(_make_signalset_generic(data, header_override='686A')).commands)
     )
 
 def get_cached_signalset(url: str, cache_name: str, signal_type: str = "generic") -> List['Command']:
     """Generic function to fetch and cache signal definitions.
 
+    Parsed commands are kept in memory for as long as the on-disk cache is
+    considered fresh, so repeated calls neither read nor parse the file again.
+
     Args:
         url: The URL to fetch the signalset from
         cache_name: The name for the cache file (without .json extension)
@@ -47,43 +75,137 @@ def get_cached_signalset(url: str, cache_name: str, signal_type: str = "generic"
     Returns:
         List of Command objects from the signalset
     """
-    os.makedirs(CACHE_DIR, exist_ok=True)
+    cache_key = (cache_name, signal_type)
+    cached = SIGNALSET_MEMORY_CACHE.get(cache_key)
+    if cached is not None and (time.time() - cached[0]) < CACHE_MAX_AGE:
+        return cached[1]
+
+    commands = _read_or_fetch_signalset(url, cache_name, signal_type)
+    # Don't hold on to a failed fetch; the next call should try again
+    if commands:
+        SIGNALSET_MEMORY_CACHE[cache_key] = (time.time(), commands)
+    return commands
+
+def _parse_commands(json_data: Union[str, bytes], signal_type: str) -> List['Command']:
+    """Parse signal definitions as the given signal type."""
+    if signal_type == "standard":
+        return _load_standard_commands(json_data)
+    else:
+        return list(SignalSet.from_json(json_data).commands)
+
+def _load_cached_commands(cache_file: Path, signal_type: str) -> List['Command']:
+    """Load commands from a cached signalset, via its pickled parse when that is current.
+
+    The pickle is only used if it is newer than both the JSON it was parsed
+    from and the module defining the command classes it contains.
+    """
+    pickle_file = cache_file.with_suffix(f".{signal_type}.pickle")
+    try:
+        pickle_mtime = pickle_file.stat().st_mtime_ns
+        is_current = (pickle_mtime >= cache_file.stat().st_mtime_ns
+                      and pickle_mtime >= SIGNALS_SOURCE.stat().st_mtime_ns)
+    except OSError:
+        is_current = False
+
+    if is_current:
+        try:
+            with open(pickle_file, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            # Truncated files or classes that changed shape since pickling; reparse the JSON
+            logger.debug("Discarding unreadable %s: %s", pickle_file, e)
+            try:
+                pickle_file.unlink()
+            except OSError:
+                pass
+
+    with open(cache_file, 'rb') as f:
+        commands = _parse_commands(f.read(), signal_type)
+    _save_cached_commands(pickle_file, commands)
+    return commands
+
+def _save_cached_commands(pickle_file: Path, commands: List['Command']) -> None:
+    """Pickle parsed commands next to their JSON; failures only cost a reparse."""
+    try:
+        with open(pickle_file, 'wb') as f:
+            pickle.dump(commands, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except (OSError, pickle.PicklingError):
+        pass
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    """Write a file through a temporary file so readers never see it half written."""
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file, path)
+
+def _open_signalset_url(url: str, etag: Optional[str] = None):
+    """Open a signalset URL, or return None if the server reports etag still current."""
+    request = urllib.request.Request(url)
+    if etag:
+        request.add_header("If-None-Match", etag)
+    try:
+        return urllib.request.urlopen(request)
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        return None
+
+def _read_or_fetch_signalset(url: str, cache_name: str, signal_type: str) -> List['Command']:
+    """Load signal definitions from the on-disk cache, fetching them when it is stale."""
     cache_file = CACHE_DIR / f"{cache_name}.json"
+    etag_file = cache_file.with_suffix(".etag")
 
     try:
         # If cache exists and is less than 24 hours old, use it
-        if cache_file.exists() and (time.time() - cache_file.stat().st_mtime) < 86400:
-            with open(cache_file) as f:
-                json_data = f.read()
-                if signal_type == "standard":
-                    return _load_standard_commands(json_data)
-                else:
-                    return list(SignalSet.from_json(json_data).commands)
+        if cache_file.exists() and (time.time() - cache_file.stat().st_mtime) < CACHE_MAX_AGE:
+            return _load_cached_commands(cache_file, signal_type)
     except Exception as e:
         print(f"Warning: Error reading {cache_name} cache: {e}")
+        # An unreadable cache must be fetched in full, not revalidated
+        etag_file.unlink(missing_ok=True)
 
     try:
-        # Fetch fresh data
-        with urllib.request.urlopen(url) as response:
-            json_data = response.read().decode('utf-8')
-            # Cache the raw data
-            with open(cache_file, 'w') as f:
-                f.write(json_data)
-
-            if signal_type == "standard":
-                return _load_standard_commands(json_data)
+        # Fetch fresh data, unless the cached copy is still current
+        etag = None
+        if cache_file.exists() and etag_file.exists():
+            etag = etag_file.read_text().strip()
+        response = _open_signalset_url(url, etag)
+        if response is None:
+            try:
+                commands = _load_cached_commands(cache_file, signal_type)
+            except Exception as e:
+                print(f"Warning: Error reading {cache_name} cache: {e}")
+                etag_file.unlink(missing_ok=True)
+                response = _open_signalset_url(url)
             else:
-                return list(SignalSet.from_json(json_data).commands)
+                # Not modified: restart the cache's age and keep using it
+                os.utime(cache_file)
+                return commands
+
+        with response:
+            # Kept as bytes, which the JSON parser reads directly
+            json_data = response.read()
+            etag = response.headers.get("ETag")
+        commands = _parse_commands(json_data, signal_type)
+
+        # Cache the raw data; rewriting it makes any pickled parse stale. The old
+        # ETag goes first so it is never paired with a partly replaced cache.
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        etag_file.unlink(missing_ok=True)
+        _write_atomically(cache_file, json_data)
+        if etag:
+            _write_atomically(etag_file, etag.encode())
+        _save_cached_commands(cache_file.with_suffix(f".{signal_type}.pickle"), commands)
+        return commands
     except Exception as e:
         print(f"Warning: Could not fetch {cache_name} signals: {e}")
         # If we have a cache file, use it even if it's old
-        if cache_file.exists():
-            with open(cache_file) as f:
-                json_data = f.read()
-                if signal_type == "standard":
-                    return _load_standard_commands(json_data)
-                else:
-                    return list(SignalSet.from_json(json_data).commands)
+        try:
+            if cache_file.exists():
+                return _load_cached_commands(cache_file, signal_type)
+        except Exception as e:
+            print(f"Warning: Error reading {cache_name} cache: {e}")
         return []
 
 def get_cached_saej1979_signals() -> List['Command']:
@@ -99,12 +221,27 @@ class ServiceType(Enum):
     SERVICE_21 = 0x21
     SERVICE_22 = 0x22
 
-@dataclass
+@dataclass(slots=True)
 class CommandResponse:
     command: 'Command'
     data: bytes
     values: Dict[str, Any]
 
+# A command paired with the ID, bound decode_value and the number of data bits
+# required to decode each of its signals
+_DecodableCommand = Tuple[Command, Tuple[Tuple[str, Callable[[bytes], Any], int], ...]]
+
+# Service IDs as integers, by the parameter type whose value is the ID as a hex string
+_SERVICE_IDS: Dict[ParameterType, int] = {
+    param_type: int(param_type.value, 16) for param_type in ParameterType
+}
+
+def _required_bits(signal_format: Union[Scaling, Enumeration]) -> int:
+    """Number of data bits a signal format needs; enumerations read missing bits as 0."""
+    if isinstance(signal_format, Scaling):
+        return signal_format.bit_offset + signal_format.bit_length
+    return 0
+
 class CommandRegistry:
     def __init__(self, commands: List['Command']):
         self.commands = commands
@@ -112,36 +249,55 @@ class CommandRegistry:
         # Group commands by parameter for efficient lookup
         self.commands_by_id: Dict[str, Command] = {}
         self.commands_by_parameter = {}
+        # The same grouping split for lookup by response: commands bound to a
+        # receive address, keyed by that address as the hex string packets carry,
+        # and generic commands. Each list holds the most recently-registered
+        # command first, which is the one that takes priority, along with its
+        # signal decoders so the signal formats aren't inspected per packet.
+        self._commands_by_receive_address: Dict[Tuple[int, int], Dict[str, List[_DecodableCommand]]] = {}
+        self._generic_commands: Dict[Tuple[int, int], List[_DecodableCommand]] = {}
         for cmd in commands:
-            # Cast cmd.parameter.type.value from a hex string to an integer
-            service_id = int(cmd.parameter.type.value, 16)
-            param_key = (service_id, cmd.parameter.value)
-            if param_key not in self.commands_by_parameter:
-                self.commands_by_parameter[param_key] = []
-            self.commands_by_parameter[param_key].append(cmd)
+            param_key = (_SERVICE_IDS[cmd.parameter.type], cmd.parameter.value)
+            self.commands_by_parameter.setdefault(param_key, []).append(cmd)
+            decodable = (cmd, tuple(
+                (signal.id, signal.format.decode_value, _required_bits(signal.format))
+                for signal in cmd.signals
+                if isinstance(signal.format, (Scaling, Enumeration))
+            ))
+            if cmd.receive_address is not None:
+                by_address = self._commands_by_receive_address.setdefault(param_key, {})
+                # Interned like packet identifiers, so lookups usually match by identity
+                receive_hex = sys.intern(f"{cmd.receive_address:X}")
+                by_address.setdefault(receive_hex, []).insert(0, decodable)
+            else:
+                self._generic_commands.setdefault(param_key, []).insert(0, decodable)
             self.commands_by_id[cmd.id] = cmd
 
+        # Response handlers by positive response byte (service ID + 0x40)
+        self._response_handlers = {
+            ServiceType.SERVICE_01.value + 0x40: self._extract_service_01_commands,
+            ServiceType.SERVICE_21.value + 0x40: self._extract_service_21_commands,
+            ServiceType.SERVICE_22.value + 0x40: self._extract_service_22_commands,
+        }
+
+    def _find_commands(self, param_key: Tuple[int, int], can_id: str) -> Tuple[List[_DecodableCommand], List[_DecodableCommand]]:
+        """Return the commands registered for can_id and the generic commands for a parameter."""
+        by_address = self._commands_by_receive_address.get(param_key)
+        matching_commands = by_address.get(can_id, []) if by_address else []
+        return matching_commands, self._generic_commands.get(param_key, [])
+
     def identify_commands(self, packet: 'CANPacket') -> List[CommandResponse]:
         """Identify and parse commands from a CAN packet."""
         data = packet.data
         if not data:
             return []
 
-        # First byte should be service response (service ID + 0x40)
-        service_response = data[0]
-        if service_response < 0x40:
+        # First byte should be service response (service ID + 0x40); any other
+        # byte, including responses below 0x40, has no handler
+        handler = self._response_handlers.get(data[0])
+        if handler is None:
             return []
-
-        service = service_response - 0x40
-        data = data[1:]  # Remove service byte
-
-        if service == ServiceType.SERVICE_01.value:
-            return self._extract_service_01_commands(packet.can_identifier, data)
-        elif service == ServiceType.SERVICE_21.value:
-            return self._extract_service_21_commands(packet.can_identifier, data)
-        elif service == ServiceType.SERVICE_22.value:
-            return self._extract_service_22_commands(packet.can_identifier, data)
-        return []
+        return handler(packet.can_identifier, data[1:])  # Remove service byte
 
     def _extract_service_22_commands(self, can_id: str, data: bytes) -> List[CommandResponse]:
         if not data or len(data) < 2:
@@ -149,141 +305,93 @@ class CommandRegistry:
 
         # Service 22 uses 2-byte PIDs
         pid = (data[0] << 8) | data[1]
-        data = data[2:]  # Remove PID bytes
-
-        param_key = (ServiceType.SERVICE_22.value, pid)
-        # Prioritize the most recently-registered command by reversing the array.
-        commands = reversed(self.commands_by_parameter.get(param_key, []))
-
-        matched_commands = []
-        matching_commands = []
-        generic_commands = []
-
-        for cmd in commands:
-            if cmd.receive_address is not None and f"{cmd.receive_address:X}" == can_id:
-                matching_commands.append(cmd)
-            elif cmd.receive_address is None:
-                generic_commands.append(cmd)
-
-        # Use the first matching command if available, otherwise use generic command
-        if matching_commands:
-            matched_commands = [matching_commands[0]]
-        elif generic_commands:
-            matched_commands = generic_commands
-
-        if not matched_commands:
-            return []
-
-        values = {}
-        remaining_data = data
-        responses = []
-        for matched_command in matched_commands:
-            for signal in matched_command.signals:
-                try:
-                    if isinstance(signal.format, Scaling):
-                        value = signal.format.decode_value(remaining_data)
-                    elif isinstance(signal.format, Enumeration):
-                        value = signal.format.decode_value(remaining_data)
-                    values[signal.id] = value
-                except Exception as e:
-                    print(f"Error decoding signal {signal.id}: {e}")
-            responses.append(CommandResponse(matched_command, remaining_data, values))
-
-        return responses
+        return self._extract(ServiceType.SERVICE_22.value, pid, data[2:], can_id)
 
     def _extract_service_21_commands(self, can_id: str, data: bytes) -> List[CommandResponse]:
         if not data:
             return []
 
-        offset = data[0]
-        data = data[1:]  # Remove offset byte
+        # Service 21 uses a 1-byte offset
+        return self._extract(ServiceType.SERVICE_21.value, data[0], data[1:], can_id)
 
-        param_key = (ServiceType.SERVICE_21.value, offset)
-        # Prioritize the most recently-registered command by reversing the array.
-        commands = reversed(self.commands_by_parameter.get(param_key, []))
-
-        matched_commands = []
-        matching_commands = []
-        generic_commands = []
+    def _extract_service_01_commands(self, can_id: str, data: bytes) -> List[CommandResponse]:
+        if not data:
+            return []
 
-        for cmd in commands:
-            if cmd.receive_address is not None and f"{cmd.receive_address:X}" == can_id:
-                matching_commands.append(cmd)
-            elif cmd.receive_address is None:
-                generic_commands.append(cmd)
+        # Service 01 uses 1-byte PIDs, and only ever decodes a single command
+        return self._extract(ServiceType.SERVICE_01.value, data[0], data[1:], can_id, single_command=True)
+
+    def _extract(
+            self,
+            service_id: int,
+            pid: int,
+            remaining_data: bytes,
+            can_id: str,
+            single_command: bool = False
+            ) -> List[CommandResponse]:
+        """Decode the commands for a service and PID from the data that follows the PID.
+
+        Args:
+            service_id: The request service ID
+            pid: The PID (or offset) the response is for
+            remaining_data: The response data after the service and PID bytes
+            can_id: The CAN identifier the response was received from
+            single_command: Decode only the first generic command rather than all of them
+
+        Returns:
+            A response for each decoded command; they share a single values dict
+        """
+        # Prioritize commands with a specific receive address matching the CAN ID
+        # before falling back to commands without a receive address filter
+        matching_commands, generic_commands = self._find_commands((service_id, pid), can_id)
 
         # Use the first matching command if available, otherwise use generic command
         if matching_commands:
-            matched_commands = [matching_commands[0]]
-        elif generic_commands:
+            matched_commands = matching_commands[:1]
+        elif single_command:
+            matched_commands = generic_commands[:1]
+        else:
             matched_commands = generic_commands
 
-        if not matched_commands:
-            return []
-
         values = {}
-        remaining_data = data
         responses = []
-        for matched_command in matched_commands:
-            for signal in matched_command.signals:
+        available_bits = len(remaining_data) * 8
+        for matched_command, decoders in matched_commands:
+            for signal_id, decode, required_bits in decoders:
+                # Report truncated responses without raising and catching an exception
+                if available_bits < required_bits:
+                    logger.warning("Error decoding signal %s: Not enough data: need %d bits, have %d",
+                                   signal_id, required_bits, available_bits)
+                    continue
                 try:
-                    if isinstance(signal.format, Scaling):
-                        value = signal.format.decode_value(remaining_data)
-                    elif isinstance(signal.format, Enumeration):
-                        value = signal.format.decode_value(remaining_data)
-                    values[signal.id] = value
+                    values[signal_id] = decode(remaining_data)
                 except Exception as e:
-                    print(f"Error decoding signal {signal.id}: {e}")
+                    logger.warning("Error decoding signal %s: %s", signal_id, e)
             responses.append(CommandResponse(matched_command, remaining_data, values))
 
         return responses
 
-    def _extract_service_01_commands(self, can_id: str, data: bytes) -> List[CommandResponse]:
-        if not data:
-            return []
-
-        pid = data[0]
-        data = data[1:]  # Remove PID byte
-
-        param_key = (ServiceType.SERVICE_01.value, pid)
-        # Prioritize the most recently-registered command by reversing the array.
-        commands = reversed(self.commands_by_parameter.get(param_key, []))
-
-        # Sort commands to prioritize those with a specific receive address matching the CAN ID
-        # before falling back to commands without a receive address filter
-        matching_commands = []
-        generic_commands = []
-
-        for cmd in commands:
-            if cmd.receive_address is not None and f"{cmd.receive_address:X}" == can_id:
-                matching_commands.append(cmd)
-            elif cmd.receive_address is None:
-                generic_commands.append(cmd)
-
-        # Use the first matching command if available, otherwise use generic command
-        matched_command = None
-        if matching_commands:
-            matched_command = matching_commands[0]
-        elif generic_commands:
-            matched_command = generic_commands[0]
-
-        if not matched_command:
-            return []
+def _registry_for_signalset(signalset: 'SignalSet') -> 'CommandRegistry':
+    """Get the registry of a signal set's commands plus the SAE J1979 base commands.
 
-        values = {}
-        remaining_data = data
-        for signal in matched_command.signals:
-            try:
-                if isinstance(signal.format, Scaling):
-                    value = signal.format.decode_value(remaining_data)
-                elif isinstance(signal.format, Enumeration):
-                    value = signal.format.decode_value(remaining_data)
-                values[signal.id] = value
-            except Exception as e:
-                print(f"Error decoding signal {signal.id}: {e}")
+    The registry built for a signal set is reused by later calls until the
+    cached SAE J1979 commands are reloaded, when it is rebuilt with the new ones.
+    """
+    # Get SAEJ1979 base signals; the same list is returned while it is fresh
+    saej1979_commands = get_cached_saej1979_signals()
 
-        return [CommandResponse(matched_command, remaining_data, values)]
+    key = id(signalset)
+    cached = _REGISTRY_BY_SIGNALSET.get(key)
+    if cached is not None:
+        signalset_ref, base_commands, registry = cached
+        if signalset_ref() is signalset and base_commands is saej1979_commands:
+            return registry
 
+    # Create command registry with the base signals combined with the provided signals
+    registry = CommandRegistry(list(saej1979_commands) + list(signalset.commands))
+    signalset_ref = weakref.ref(signalset, lambda _, key=key: _REGISTRY_BY_SIGNALSET.pop(key, None))
+    _REGISTRY_BY_SIGNALSET[key] = (signalset_ref, saej1979_commands, registry)
+    return registry
 
 def decode_obd_response(
         signalset: 'SignalSet',
@@ -300,12 +408,7 @@ def decode_obd_response(
     Returns:
         Dictionary mapping signal IDs to their decoded values
     """
-    # Get SAEJ1979 base signals and combine with provided signals
-    saej1979_commands = get_cached_saej1979_signals()
-    combined_commands = list(saej1979_commands) + list(signalset.commands)
-
-    # Create command registry with combined commands
-    registry = CommandRegistry(combined_commands)
+    registry = _registry_for_signalset(signalset)
 
     # Parse CAN frames from response
     scanner = CANFrameScanner.from_ascii_string(
@@ -313,8 +416,6 @@ def decode_obd_response(
         can_id_format=can_id_format,
         extended_addressing_enabled=extended_addressing_enabled
     )
-    if not scanner:
-        raise ValueError(f"Could not parse response: {response_hex}")
 
     # Process each CAN packet
     results = {}
@@ -353,8 +454,9 @@ def get_model_year_command_registry(model_year: int) -> 'CommandRegistry':
         # Get SAE J1979 base signals (always first)
         saej1979_commands = get_cached_saej1979_signals()
 
-        # Initialize the list with SAE J1979 commands
-        combined_commands = list(saej1979_commands)
+        # Command sources in priority order, starting with SAE J1979. The shared
+        # base lists are chained rather than copied for every model year.
+        command_sources = [saej1979_commands]
 
         # Extract the make from the repo name using our utility function
         make = extract_make_from_repo_name()
@@ -362,7 +464,7 @@ def get_model_year_command_registry(model_year: int) -> 'CommandRegistry':
         # Check if the make is Nissan or Infiniti and add those commands
         if make and isinstance(make, str) and make.lower() in ['nissan', 'infiniti']:
             nissan_infiniti_commands = get_cached_nissan_infiniti_signals()
-            combined_commands.extend(nissan_infiniti_commands)
+            command_sources.append(nissan_infiniti_commands)
             print(f"Added Nissan/Infiniti signals for {make} vehicle")
 
         # Check if the model-specific signalset is empty and we need to use the make repo
@@ -376,15 +478,16 @@ def get_model_year_command_registry(model_year: int) -> 'CommandRegistry':
                     print(f"Using {make} signals for model year {model_year}")
 
         # Add model-specific or make-specific signals to the combined commands
-        combined_commands.extend(list(signalset.commands))
+        command_sources.append(signalset.commands)
 
-        # Filter combined_commands by each command's optional .filter property.
+        # Filter the combined commands by each command's optional .filter property.
         if model_year is not None:
-            filtered_commands = []
-            for cmd in combined_commands:
-                if cmd.filter is None or cmd.filter.matches(model_year):
-                    filtered_commands.append(cmd)
-            combined_commands = filtered_commands
+            combined_commands = [
+                cmd for cmd in chain.from_iterable(command_sources)
+                if cmd.filter is None or cmd.filter.matches(model_year)
+            ]
+        else:
+            combined_commands = list(chain.from_iterable(command_sources))
 
         # Create and cache the registry
         registry = CommandRegistry(combined_commands)
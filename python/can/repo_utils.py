@@ -1,7 +1,29 @@
+from functools import lru_cache
 from pathlib import Path
-import os
-import inspect
 
+# Makes whose names contain hyphens, as the prefix they give repository names
+SPECIAL_MAKE_PREFIXES = ("Mercedes-Benz-", "Alfa-Romeo-", "Aston-Martin-", "Land-Rover-", "Rolls-Royce-")
+
+def _find_repo_name() -> str:
+    """Name of the nearest directory above this file with a dash in its name."""
+    # Get the repository name by traversing up from this file's location
+    # until we find a directory with a dash in the name
+    current_dir = Path(__file__).parent
+
+    # Walk up the directory tree to find the repository root
+    while current_dir.name and '-' not in current_dir.name:
+        parent = current_dir.parent
+        # Check if we've reached the filesystem root
+        if parent == current_dir:
+            break
+        current_dir = parent
+
+    return current_dir.name
+
+# Name of the repository this checkout lives in, e.g. "Ford-F-150"
+REPO_NAME = _find_repo_name()
+
+@lru_cache(maxsize=None)
 def extract_make_from_repo_name(repo_name=None):
     """
     Extract the make name from a repository name.
@@ -14,27 +36,12 @@ def extract_make_from_repo_name(repo_name=None):
         str: The make name or None if not determinable.
     """
     if not repo_name:
-        # Get the repository name by traversing up from this file's location
-        # until we find a directory with a dash in the name
-        file_path = Path(inspect.getframeinfo(inspect.currentframe()).filename)
-        current_dir = file_path.parent
-
-        # Walk up the directory tree to find the repository root
-        while current_dir.name and '-' not in current_dir.name:
-            parent = current_dir.parent
-            # Check if we've reached the filesystem root
-            if parent == current_dir:
-                break
-            current_dir = parent
-
-        repo_name = current_dir.name
+        repo_name = REPO_NAME
 
     # Handle special cases for makes with hyphens in their names
-    special_makes_with_hyphens = ["Mercedes-Benz", "Alfa-Romeo", "Aston-Martin", "Land-Rover", "Rolls-Royce"]
-
-    for make in special_makes_with_hyphens:
-        if repo_name.startswith(make + "-"):
-            return make
+    for prefix in SPECIAL_MAKE_PREFIXES:
+        if repo_name.startswith(prefix):
+            return prefix[:-1]
 
     # Extract the make (everything before the first hyphen) for standard cases
     parts = repo_name.split('-')
@@ -1,7 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Dict, Optional, Set, Union, Tuple
-import json
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Union, Tuple
+
+try:
+    # orjson is optional; it parses signal sets several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from .can_frame import CANIDFormat
 
@@ -12,27 +19,55 @@ class ParameterType(Enum):
     SERVICE_21 = "21"
     SERVICE_22 = "22"
 
-@dataclass(frozen=True)
+def _field_values(instance) -> tuple:
+    """A dataclass instance's constructor field values, in field order, without copying them."""
+    return tuple(getattr(instance, f.name) for f in fields(instance) if f.init)
+
+def _derived():
+    """A slot for a value __post_init__ derives from the other fields."""
+    return field(init=False, repr=False, compare=False, default=None)
+
+@lru_cache(maxsize=None)
+def _parse_hex(value: str) -> int:
+    """Parse a hex string field; headers, addresses and PIDs repeat across commands, so each is parsed once."""
+    return int(value, 16)
+
+# JSON key of each parameter type, in the order they are looked for
+_PARAMETER_KEYS = tuple(
+    (param_type.value, param_type)
+    for param_type in (ParameterType.SERVICE_21, ParameterType.SERVICE_22, ParameterType.SERVICE_01)
+)
+
+@dataclass(frozen=True, slots=True)
 class Parameter:
     type: ParameterType
     value: Union[int, str]
 
     @staticmethod
     def from_json(data: Dict) -> 'Parameter':
-        for param_type in [ParameterType.SERVICE_21, ParameterType.SERVICE_22, ParameterType.SERVICE_01]:
-            if param_type.value in data:
+        for key, param_type in _PARAMETER_KEYS:
+            value = data.get(key)
+            if value is not None:
                 # Handle both string and integer representations
-                value = data[param_type.value]
                 if isinstance(value, str):
-                    value = int(value, 16)
+                    value = _parse_hex(value)
                 return Parameter(param_type, value)
         raise ValueError(f"Invalid parameter format: {data}")
 
     def as_message(self) -> str:
-        if self.type == ParameterType.SERVICE_22:
-            return f"{self.type.value}{self.value:04X}"
-        else:
-            return f"{self.type.value}{self.value:02X}"
+        return _parameter_message(self.type, self.value)
+
+# Hex digits of the parameter value in a request, by service
+_PARAMETER_VALUE_WIDTHS = {
+    ParameterType.SERVICE_01: 2,
+    ParameterType.SERVICE_21: 2,
+    ParameterType.SERVICE_22: 4,
+}
+
+@lru_cache(maxsize=None)
+def _parameter_message(param_type: ParameterType, value: int) -> str:
+    """Request message for a parameter; there are few distinct ones, so each is formatted once."""
+    return f"{param_type.value}{value:0{_PARAMETER_VALUE_WIDTHS[param_type]}X}"
 
 class UnitCategory(Enum):
     TEMPERATURE = "temperature"
@@ -58,7 +93,7 @@ class UnitCategory(Enum):
     ACCELERATION = "acceleration"
     UNKNOWN = "unknown"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Scaling:
     bit_length: int
     max_value: float
@@ -75,6 +110,17 @@ class Scaling:
     optimal_min: Optional[float] = None
     optimal_max: Optional[float] = None
     optimal_value: Optional[float] = None
+    # Derived in __post_init__
+    _end_bit: int = _derived()
+    _start_byte: int = _derived()
+    _end_byte: int = _derived()
+    _shift: int = _derived()
+    _mask: int = _derived()
+    _sign_bit: int = _derived()
+    _sign_sub: int = _derived()
+    _byte_order: str = _derived()
+    _swap_end: Optional[int] = _derived()
+    _clamp: bool = _derived()
 
     @staticmethod
     def from_json(data: Dict) -> 'Scaling':
@@ -96,79 +142,84 @@ class Scaling:
             optimal_value=data.get('oval')
         )
 
+    def __post_init__(self):
+        # Everything decode_value derives from the frozen fields, computed once
+        end_bit = self.bit_offset + self.bit_length
+        end_byte = (end_bit + 7) // 8
+        object.__setattr__(self, '_end_bit', end_bit)
+        object.__setattr__(self, '_start_byte', self.bit_offset // 8)
+        object.__setattr__(self, '_end_byte', end_byte)
+        object.__setattr__(self, '_shift', end_byte * 8 - end_bit)
+        object.__setattr__(self, '_mask', (1 << self.bit_length) - 1)
+        object.__setattr__(self, '_sign_bit', 1 << (self.bit_length - 1) if self.bit_length > 0 else 0)
+        object.__setattr__(self, '_sign_sub', 1 << self.bit_length)
+        swap_bytes = self.bytes_lsb and self.bit_length > 8
+        # A byte-aligned little-endian value spans exactly the bytes to reverse, so it
+        # is read in little-endian order; otherwise the bytes are reversed in a copy
+        byte_aligned = self.bit_offset % 8 == 0
+        object.__setattr__(self, '_byte_order', 'little' if swap_bytes and byte_aligned else 'big')
+        object.__setattr__(self, '_swap_end', self.bit_offset // 8 + (self.bit_length + 7) // 8
+                           if swap_bytes and not byte_aligned else None)
+        object.__setattr__(self, '_clamp', self.max_value > self.min_value)
+
     def decode_value(self, data: bytes) -> float:
         """Decode a value from bytes using the scaling parameters."""
         raw_value = self._extract_bits(data)
-        if self.signed:
-            raw_value = self._twos_complement(raw_value, self.bit_length)
+        if self.signed and raw_value & self._sign_bit:
+            raw_value -= self._sign_sub
 
         value = (raw_value * self.scalar / self.divisor) + self.offset
 
-        if self.max_value > self.min_value:
+        if self._clamp:
             value = max(self.min_value, min(value, self.max_value))
 
         return value
 
+    def decode_batch(self, payloads: Iterable[bytes]) -> List[float]:
+        """Decode the value from each of many payloads, e.g. a log of responses."""
+        decode_value = self.decode_value
+        return [decode_value(data) for data in payloads]
+
     def _extract_bits(self, data: bytes) -> int:
         """Extract bits from byte data according to offset and length."""
-        total_bits = len(data) * 8
-        start_bit = self.bit_offset
-        end_bit = start_bit + self.bit_length
+        if len(data) < self._end_byte:
+            raise ValueError(f"Not enough data: need {self._end_bit} bits, have {len(data) * 8}")
 
-        if end_bit > total_bits:
-            raise ValueError(f"Not enough data: need {end_bit} bits, have {total_bits}")
-
-        # Create a mutable copy of the data
-        data_array = bytearray(data)
-
-        if self.bytes_lsb and self.bit_length > 8:
+        start_byte = self._start_byte
+        swap_end = self._swap_end
+        if swap_end is not None:
             # Only reverse the bytes that contain our value
-            start_byte = start_bit // 8
-            byte_count = (self.bit_length + 7) // 8
-            end_byte = min(start_byte + byte_count, len(data_array))
-
-            # Extract the bytes we need to reverse
-            reversed_section = bytearray(reversed(data_array[start_byte:end_byte]))
+            data = data[:start_byte] + data[start_byte:swap_end][::-1] + data[swap_end:]
 
-            # Replace the original bytes with the reversed ones
-            data_array[start_byte:end_byte] = reversed_section
+        # Convert only the bytes spanned by the value, then drop the bits either side of it
+        window = int.from_bytes(data[start_byte:self._end_byte], self._byte_order)
+        return (window >> self._shift) & self._mask
 
-            # Convert back to immutable bytes
-            data = bytes(data_array)
-
-        result = 0
-        for i in range(start_bit, end_bit):
-            byte_idx = i // 8
-            bit_idx = 7 - (i % 8)  # MSB format
-            if (data[byte_idx] & (1 << bit_idx)) != 0:
-                result |= 1 << (end_bit - i - 1)
-
-        return result
-
-    def _twos_complement(self, value: int, bits: int) -> int:
-        """Convert two's complement value to signed integer."""
-        if value & (1 << (bits - 1)):
-            value -= 1 << bits
-        return value
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnumerationValue:
     value: str
     description: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Enumeration:
     bit_length: int
     map: Dict[str, EnumerationValue]
     bit_offset: int = 0
+    # Derived in __post_init__
+    _start_byte: int = _derived()
+    _end_byte: int = _derived()
+    _shift: int = _derived()
+    _mask: int = _derived()
+    _hash: int = _derived()
+    _values_by_raw: Dict[int, str] = _derived()
 
     def __hash__(self) -> int:
-        # Convert the map to a tuple of sorted items to make it hashable
-        map_items = tuple(sorted(
-            (k, hash(v))
-            for k, v in self.map.items()
-        ))
-        return hash((self.bit_length, map_items, self.bit_offset))
+        return self._hash
+
+    def __reduce__(self):
+        # String hashes differ between processes, so unpickling recomputes the
+        # cached hash rather than restoring it
+        return (Enumeration, (self.bit_length, self.map, self.bit_offset))
 
     @staticmethod
     def from_json(data: Dict) -> 'Enumeration':
@@ -182,27 +233,42 @@ class Enumeration:
             map=value_map
         )
 
+    def __post_init__(self):
+        end_bit = self.bit_offset + self.bit_length
+        end_byte = (end_bit + 7) // 8
+        object.__setattr__(self, '_start_byte', self.bit_offset // 8)
+        object.__setattr__(self, '_end_byte', end_byte)
+        object.__setattr__(self, '_shift', end_byte * 8 - end_bit)
+        object.__setattr__(self, '_mask', (1 << self.bit_length) - 1)
+        # Convert the map to a tuple of sorted items to make it hashable; sorting
+        # it is the expensive part, so it is done once rather than per hash
+        map_items = tuple(sorted(
+            (k, hash(v))
+            for k, v in self.map.items()
+        ))
+        object.__setattr__(self, '_hash', hash((self.bit_length, map_items, self.bit_offset)))
+        # Mapped values by raw integer, so decoding needn't format the raw value as
+        # a string; keys that aren't plain decimal could never match one anyway
+        object.__setattr__(self, '_values_by_raw', {
+            int(k): v.value for k, v in self.map.items() if isinstance(k, str) and k.isdecimal() and str(int(k)) == k
+        })
+
     def decode_value(self, data: bytes) -> Optional[str]:
         """Decode an enumerated value from bytes.
 
         Returns:
             The string value for the mapped enum, or None if no mapping exists
         """
-        # First extract the raw value as an integer
-        raw_value = 0
-        for i in range(self.bit_length):
-            byte_idx = (self.bit_offset + i) // 8
-            bit_idx = 7 - ((self.bit_offset + i) % 8)  # MSB format
-            if byte_idx < len(data) and (data[byte_idx] & (1 << bit_idx)) != 0:
-                raw_value |= 1 << (self.bit_length - i - 1)
-
-        # Convert to string and look up in map
-        str_value = str(raw_value)
-        if str_value in self.map:
-            return self.map[str_value].value
-        return None  # Return None when no mapping exists instead of raw value
-
-@dataclass(frozen=True)
+        # First extract the raw value as an integer; bits past the end of the data read as 0
+        missing_bytes = self._end_byte - len(data)
+        if missing_bytes > 0:
+            data = bytes(data) + bytes(missing_bytes)
+        window = int.from_bytes(data[self._start_byte:self._end_byte], 'big')
+
+        # Return None when no mapping exists instead of raw value
+        return self._values_by_raw.get((window >> self._shift) & self._mask)
+
+@dataclass(frozen=True, slots=True)
 class Signal:
     id: str
     name: str
@@ -230,34 +296,54 @@ class Signal:
             suggested_metric=data.get('suggestedMetric')
         )
 
-@dataclass(frozen=True)
+def _year_in(model_year: int, years: FrozenSet[int]) -> bool:
+    return model_year in years
+
+def _year_outside(model_year: int, from_year: int, to_year: int, years: FrozenSet[int]) -> bool:
+    return model_year >= from_year or model_year <= to_year or model_year in years
+
+def _year_at_most(model_year: int, to_year: int, years: FrozenSet[int]) -> bool:
+    return model_year <= to_year or model_year in years
+
+def _year_at_least(model_year: int, from_year: int, years: FrozenSet[int]) -> bool:
+    return model_year >= from_year or model_year in years
+
+@dataclass(frozen=True, slots=True)
 class Filter:
     from_year: Optional[int] = None
     to_year: Optional[int] = None
     years: Optional[Set[int]] = None
+    # Derived in __post_init__
+    _matcher: Tuple = _derived()
+    _id_string: str = _derived()
 
     def __hash__(self) -> int:
         # Convert the years set to a frozenset to make it hashable
         years_tuple = frozenset(self.years) if self.years is not None else None
         return hash((self.from_year, self.to_year, years_tuple))
 
+    def __post_init__(self):
+        # Pick the check for this filter's shape once; matches() just applies it.
+        # Module-level functions rather than closures keep filters picklable.
+        years = frozenset(self.years) if self.years is not None else frozenset()
+        if self.from_year is not None and self.to_year is not None:
+            if self.from_year < self.to_year:
+                matcher = (_year_in, (years | frozenset(range(self.from_year, self.to_year + 1)),))
+            else:
+                # Wraps around, matching everything outside the range
+                matcher = (_year_outside, (self.from_year, self.to_year, years))
+        elif self.to_year is not None:
+            matcher = (_year_at_most, (self.to_year, years))
+        elif self.from_year is not None:
+            matcher = (_year_at_least, (self.from_year, years))
+        else:
+            matcher = (_year_in, (years,))
+        object.__setattr__(self, '_matcher', matcher)
+        object.__setattr__(self, '_id_string', self._format_id_string())
+
     def matches(self, model_year: Optional[int]) -> bool:
-        if model_year is not None:
-            if self.from_year is not None and self.to_year is not None:
-                if self.from_year < self.to_year:
-                    if self.from_year <= model_year <= self.to_year:
-                        return True
-                elif model_year >= self.from_year or model_year <= self.to_year:
-                    return True
-            elif self.to_year is not None:
-                if model_year <= self.to_year:
-                    return True
-            elif self.from_year is not None:
-                if model_year >= self.from_year:
-                    return True
-            if self.years is not None and model_year in self.years:
-                return True
-        return False
+        match, args = self._matcher
+        return model_year is not None and match(model_year, *args)
 
     @staticmethod
     def from_json(data: Dict) -> 'Filter':
@@ -269,6 +355,9 @@ class Filter:
 
     def to_id_string(self) -> str:
         """Convert the filter to a string representation for use in command IDs."""
+        return self._id_string
+
+    def _format_id_string(self) -> str:
         parts = []
 
         if self.from_year is not None and self.to_year is not None and self.from_year < self.to_year:
@@ -284,7 +373,7 @@ class Filter:
 
         return ";".join(parts)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Command:
     id: str
     parameter: Parameter
@@ -299,21 +388,43 @@ class Command:
     debug: bool = False
     filter: Optional[Filter] = None
     protocol: Optional[CANIDFormat] = None
+    # Derived in __post_init__
+    _signals_by_id: Dict[str, Signal] = _derived()
+    _hash: int = _derived()
 
     ID_PROPERTY_DIVIDER = "|"
 
+    def __post_init__(self):
+        object.__setattr__(self, '_signals_by_id', {signal.id: signal for signal in self.signals})
+        # Hashing a command recurses through every signal and its format, and
+        # signal sets hash each command at least once, so it is computed once
+        object.__setattr__(self, '_hash', hash(_field_values(self)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        # String hashes differ between processes, so unpickling recomputes the
+        # cached hash rather than restoring it
+        return (Command, _field_values(self))
+
+    def signal_by_id(self, signal_id: str) -> Optional[Signal]:
+        """Look up one of this command's signals by its ID."""
+        return self._signals_by_id.get(signal_id)
+
     @staticmethod
     def from_json(data: Dict) -> 'Command':
-        header = int(data['hdr'], 16)
-        receive_address = int(data['rax'], 16) if 'rax' in data else None
-        signals = tuple(sorted(
-            (Signal.from_json(s) for s in data['signals']),
-            key=lambda x: x.id
-        ))
+        header_str = data['hdr']
+        header_length = len(header_str)
+        header = _parse_hex(header_str)
+        receive_address = _parse_hex(data['rax']) if 'rax' in data else None
+        signals = [Signal.from_json(s) for s in data['signals']]
+        signals.sort(key=attrgetter('id'))
+        signals = tuple(signals)
 
-        can_priority = int(data['pri'], 16) if 'pri' in data else None
+        can_priority = _parse_hex(data['pri']) if 'pri' in data else None
 
-        if receive_address and len(data['hdr']) == 4:
+        if receive_address and header_length == 4:
             priority = (can_priority or 0x18) & 0b0001_1111
             if receive_address <= 255:
                 receive_address = (priority << 24) | 0x00DAF100 | (receive_address & 0xFF)
@@ -326,14 +437,13 @@ class Command:
         parameter = Parameter.from_json(data['cmd'])
 
         # Format additional properties for ID
-        extended_address = int(data['eax'], 16) if 'eax' in data else None
-        tester_address = int(data['tst'], 16) if 'tst' in data else None
-        timeout = int(data['tmo'], 16) if 'tmo' in data else None
+        extended_address = _parse_hex(data['eax']) if 'eax' in data else None
+        tester_address = _parse_hex(data['tst']) if 'tst' in data else None
+        timeout = _parse_hex(data['tmo']) if 'tmo' in data else None
         force_flow_control = data.get('fcm1', False)
         car_protocol_strategy = data.get('proto')
-        can_priority = int(data['pri'], 16) if 'pri' in data else None
 
-        id = data['hdr']
+        id = header_str
         if data.get('rax'):
             id += '.' + data['rax']
         id += '.' + parameter.as_message()
@@ -348,9 +458,9 @@ class Command:
         )
         if properties_string:
             id += Command.ID_PROPERTY_DIVIDER + properties_string
-        if len(data['hdr']) == 3:
+        if header_length == 3:
             protocol = CANIDFormat.ELEVEN_BIT
-        elif len(data['hdr']) == 4:
+        elif header_length == 4:
             protocol = CANIDFormat.TWENTY_NINE_BIT
         else:
             protocol = None
@@ -362,10 +472,10 @@ class Command:
             receive_address=receive_address,
             signals=signals,
             update_frequency=data['freq'],
-            extended_address=int(data['eax'], 16) if 'eax' in data else None,
-            tester_address=int(data['tst'], 16) if 'tst' in data else None,
-            timeout=int(data['tmo'], 16) if 'tmo' in data else None,
-            force_flow_control=data.get('fcm1', False),
+            extended_address=extended_address,
+            tester_address=tester_address,
+            timeout=timeout,
+            force_flow_control=force_flow_control,
             debug=data.get('dbg', False),
             filter=command_filter,
             protocol=protocol
@@ -373,40 +483,52 @@ class Command:
 
     @staticmethod
     def _format_properties_for_id(extended_address, tester_address, timeout, force_flow_control, filter, car_protocol_strategy=None, can_priority=None):
-        parts = []
+        return _format_id_properties(
+            extended_address, tester_address, timeout, force_flow_control,
+            filter.to_id_string() if filter else None, car_protocol_strategy, can_priority
+        )
 
-        if timeout:
-            parts.append(f"t={timeout:02X}")
+@lru_cache(maxsize=None)
+def _format_id_properties(extended_address, tester_address, timeout, force_flow_control, filter_id, car_protocol_strategy, can_priority) -> str:
+    """Properties part of a command ID; few distinct combinations occur, so each is formatted once."""
+    parts = []
 
-        if extended_address:
-            parts.append(f"e={extended_address:02X}")
+    if timeout:
+        parts.append(f"t={timeout:02X}")
 
-        if tester_address:
-            parts.append(f"ta={tester_address:02X}")
+    if extended_address:
+        parts.append(f"e={extended_address:02X}")
 
-        if force_flow_control:
-            parts.append("fc=1")
+    if tester_address:
+        parts.append(f"ta={tester_address:02X}")
 
-        if car_protocol_strategy == "iso9141_2":
-            parts.append("p=9141-2")
+    if force_flow_control:
+        parts.append("fc=1")
 
-        if can_priority:
-            parts.append(f"c={can_priority:02X}")
+    if car_protocol_strategy == "iso9141_2":
+        parts.append("p=9141-2")
 
-        if filter:
-            parts.append(f"f={filter.to_id_string()}")
+    if can_priority:
+        parts.append(f"c={can_priority:02X}")
 
-        return ",".join(parts)
+    if filter_id is not None:
+        parts.append(f"f={filter_id}")
 
-@dataclass
+    return ",".join(parts)
+
+# Weak-referenceable so per-signal-set caches don't keep signal sets alive
+@dataclass(slots=True, weakref_slot=True)
 class SignalSet:
     commands: Set[Command]
     diagnostic_level: Optional[int] = None
     signal_groups: Optional[Set] = None
 
     @classmethod
-    def from_json(cls, json_data: str) -> 'SignalSet':
-        data = json.loads(json_data)
+    def from_json(cls, json_data: Union[str, bytes]) -> 'SignalSet':
+        return cls.from_dict(json_loads(json_data))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SignalSet':
         commands = {Command.from_json(cmd) for cmd in data['commands']}
         diagnostic_level = int(data['diagnosticLevel'], 16) if 'diagnosticLevel' in data else None
 
@@ -6,7 +6,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from can.can_frame import (
-    CANFrame, CANFrameScanner, CANIDFormat, CANFrameError,
+    CANFrame, CANFrameBatch, CANFrameScanner, CANIDFormat, CANFrameError,
     DataFrameType, DataFrameHeader, CANFramePart, CANPacket
 )
 
@@ -247,6 +247,20 @@ def test_malformed_frame_parts():
         CANFrame.from_line("7E8034ZZ", can_id_format=CANIDFormat.ELEVEN_BIT)
     assert excinfo.value.part == CANFramePart.DATA
 
+def test_invalid_header_nibbles():
+    """Test that non-hex characters in header fields are rejected."""
+    # Invalid single frame size
+    with pytest.raises(CANFrameError):
+        CANFrame.from_line("7E80G410D00", can_id_format=CANIDFormat.ELEVEN_BIT)
+
+    # Invalid first frame size
+    with pytest.raises(CANFrameError):
+        CANFrame.from_line("7E810X4490201534231", can_id_format=CANIDFormat.ELEVEN_BIT)
+
+    # Invalid consecutive frame index
+    with pytest.raises(CANFrameError):
+        CANFrame.from_line("7E82Z5A53334A453630", can_id_format=CANIDFormat.ELEVEN_BIT)
+
 def test_whitespace_handling():
     """Test that whitespace is correctly handled."""
     # Test with spaces between characters
@@ -308,6 +322,80 @@ def test_multiple_packets():
     with pytest.raises(StopIteration):
         next(scanner)
 
+def test_bulk_parsing_matches_per_line_parsing():
+    """Test that bulk parsing produces the same frames as parsing each line."""
+    lines = [
+        "7E81014490201534231",
+        "7DF3010000000000",
+        "7E8215A53334A453630",
+        "7E82245323832313032",
+    ]
+    scanner = CANFrameScanner.from_ascii_lines_bulk(lines, can_id_format=CANIDFormat.ELEVEN_BIT)
+
+    expected = [CANFrame.from_line(line, can_id_format=CANIDFormat.ELEVEN_BIT) for line in lines]
+    assert scanner.frames == expected
+
+def test_bulk_parsing_skips_invalid_hex_frames():
+    """Test that a frame with invalid hex data doesn't drop the other frames."""
+    lines = [
+        "7E80341AAAA",
+        "7E8034ZZZZZ",
+        "7E80343CCCC",
+    ]
+    scanner = CANFrameScanner.from_ascii_lines_bulk(lines, can_id_format=CANIDFormat.ELEVEN_BIT)
+
+    assert [frame.data for frame in scanner.frames] == [
+        bytes.fromhex("41AAAA"),
+        bytes.fromhex("43CCCC"),
+    ]
+
+def test_bulk_parsing_reads_headers_around_flow_control():
+    """Test that frames decoded from the shared buffer stay aligned around flow control frames."""
+    lines = [
+        "18DAF1101123490201534231",
+        "18DA10F1301000000000000",
+        "18DAF110215A53334A453630",
+    ]
+    scanner = CANFrameScanner.from_ascii_lines_bulk(lines, can_id_format=CANIDFormat.TWENTY_NINE_BIT)
+
+    assert [frame.data_frame_header for frame in scanner.frames] == [
+        DataFrameHeader(DataFrameHeader.Type.FIRST, 0x123),
+        DataFrameHeader(DataFrameHeader.Type.FLOW),
+        DataFrameHeader(DataFrameHeader.Type.CONSECUTIVE, 1),
+    ]
+    assert [frame.data for frame in scanner.frames] == [
+        bytes.fromhex("490201534231"),
+        bytes.fromhex("01000000000000"),
+        bytes.fromhex("5A53334A453630"),
+    ]
+
+def test_frame_batch_columns(capsys):
+    """Test that a frame batch stores each frame field column-wise."""
+    response = """
+    7E81014490201534231
+    7DF3010000000000
+    7E8215A53334A453630
+    7E8034ZZZZZ
+    """
+    batch = CANFrameBatch.from_ascii_string(response, can_id_format=CANIDFormat.ELEVEN_BIT)
+
+    assert len(batch) == 3
+    assert batch.can_identifiers == ["7E8", "7DF", "7E8"]
+    assert batch.data_frame_types == [
+        DataFrameType.FIRST_FRAME,
+        DataFrameType.FLOW_CONTROL_FRAME,
+        DataFrameType.CONSECUTIVE_FRAME,
+    ]
+    assert [header.value for header in batch.data_frame_headers] == [20, None, 1]
+    assert batch.payloads == [
+        bytes.fromhex("490201534231"),
+        bytes.fromhex("010000000000"),
+        bytes.fromhex("5A53334A453630"),
+    ]
+    assert batch.select_by_id("7E8") == [0, 2]
+    assert batch.frames() == CANFrameScanner.from_ascii_string(response).frames
+    assert "Error parsing frame: Invalid hex data" in capsys.readouterr().out
+
 def test_direct_packet_creation():
     """Test direct creation of CANPacket objects."""
     packet = CANPacket(
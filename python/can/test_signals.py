@@ -1,7 +1,7 @@
 import pytest
 from typing import Optional, Set
 
-from .signals import Filter
+from .signals import Enumeration, EnumerationValue, Filter, Scaling
 
 
 @pytest.mark.parametrize(
@@ -110,3 +110,56 @@ def test_filter_from_json_partial_none_values():
     assert f.matches(2005)
     assert not f.matches(1999)
     assert f.matches(2001)
+
+
+@pytest.mark.parametrize(
+    "scaling_params, data, expected",
+    [
+        # Byte-aligned big-endian value
+        ({"bit_length": 16, "bit_offset": 8}, bytes.fromhex("AA1234BB"), 0x1234),
+        # Value straddling byte boundaries
+        ({"bit_length": 12, "bit_offset": 4}, bytes.fromhex("ABCDEF"), 0xBCD),
+        # Little-endian bytes
+        ({"bit_length": 16, "bytes_lsb": True}, bytes.fromhex("3412"), 0x1234),
+        # Signed value
+        ({"bit_length": 8, "signed": True}, bytes.fromhex("FE"), -2),
+    ],
+)
+def test_scaling_extracts_bits(scaling_params, data: bytes, expected: int):
+    scaling = Scaling(max_value=0, unit="scalar", **scaling_params)
+    assert scaling.decode_value(data) == expected
+
+
+def test_scaling_rejects_short_data():
+    with pytest.raises(ValueError):
+        Scaling(bit_length=16, bit_offset=8, max_value=0, unit="scalar").decode_value(b"\x01\x02")
+
+
+def test_enumeration_reads_missing_bits_as_zero():
+    enumeration = Enumeration(
+        bit_length=4,
+        bit_offset=6,
+        map={"8": EnumerationValue("EIGHT", "Eight"), "12": EnumerationValue("TWELVE", "Twelve")},
+    )
+    assert enumeration.decode_value(bytes.fromhex("03")) == "TWELVE"
+    assert enumeration.decode_value(bytes.fromhex("02")) == "EIGHT"
+
+
+def test_scaling_decode_batch_matches_decode_value():
+    scaling = Scaling(bit_length=16, bit_offset=4, bytes_lsb=True, signed=True,
+                      divisor=10, min_value=-100, max_value=100, unit="scalar")
+    payloads = [bytes.fromhex("012345"), bytes.fromhex("FFFFFF"), bytes.fromhex("A0B0C0D0")]
+    assert scaling.decode_batch(payloads) == [scaling.decode_value(payload) for payload in payloads]
+
+    with pytest.raises(ValueError):
+        scaling.decode_batch([bytes.fromhex("0102")])
+
+
+def test_enumeration_hash_survives_pickling():
+    import pickle
+
+    enumeration = Enumeration(bit_length=2, map={"1": EnumerationValue("ON", "On")})
+    restored = pickle.loads(pickle.dumps(enumeration))
+    assert restored == enumeration
+    assert hash(restored) == hash(enumeration)
+    assert "_hash" not in pickle.dumps(enumeration).decode("latin-1")
@@ -10,16 +10,20 @@ a 'suggestedMetric' property from each file, and creates a mapping where:
 
 import argparse
 import json
+import logging
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 # Add the parent directory to the path so we can import the signalsets module
 sys.path.insert(0, str(Path(__file__).parent))
 
 from can.repo_utils import extract_make_from_repo_name
+from can.signals import json_loads
 
 try:
     from signalsets.loader import load_signalset
@@ -27,6 +31,51 @@ except ImportError:
     print("Error: Could not import signalsets module. Make sure you're running this from the root directory.")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
+
+def _generate_filter_key(filter_data: Optional[Dict]) -> str:
+    """The connectables key for a command's filter, e.g. "<=2020" or "2018<=", or "ALL"."""
+    if not filter_data:
+        return "ALL"
+
+    years = filter_data.get('years')  # Expected to be a list from JSON
+    filter_values = (filter_data.get('to'), filter_data.get('from'),
+                     tuple(years) if years and isinstance(years, list) else None)
+    try:
+        return _format_filter_key(*filter_values)
+    except TypeError:
+        # Malformed filter values that can't be hashed can't be cached either
+        return _format_filter_key.__wrapped__(*filter_values)
+
+
+# Commands in a signalset share a handful of distinct filters, so each key is formatted once
+@lru_cache(maxsize=1024, typed=True)
+def _format_filter_key(to_year: Any, from_year: Any, years: Optional[Tuple]) -> str:
+    key_parts = []
+
+    if to_year is not None:
+        key_parts.append(f"<={to_year}")
+
+    if from_year is not None:
+        key_parts.append(f"{from_year}<=")
+
+    if years:
+        try:
+            # Ensure years are numbers and sorted for consistent key generation
+            num_years = sorted([int(y) for y in years if y is not None])
+            if num_years:  # Add only if there are valid years after processing
+                key_parts.append(",".join(map(str, num_years)))
+        except (ValueError, TypeError):
+            # If years contains non-convertible items or is not iterable as expected,
+            # silently skip this part of the key.
+            pass
+
+    if not key_parts:  # Filter object existed but was empty or yielded no valid parts
+        return "ALL"
+
+    return ",".join(key_parts)
+
 
 def extract_connectables(signalset_data: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
     """
@@ -44,141 +93,219 @@ def extract_connectables(signalset_data: Dict[str, Any]) -> Dict[str, Dict[str,
     """
     connectables_by_filter: Dict[str, Dict[str, str]] = {}
 
-    def _generate_filter_key(filter_data: Optional[Dict]) -> str:
-        if not filter_data:
-            return "ALL"
+    # Process individual signals in each command
+    for command in signalset_data.get("commands", ()):
+        filter_key = _generate_filter_key(command.get("filter"))
+
+        current_filter_connectables = connectables_by_filter.get(filter_key)
+        if current_filter_connectables is None:
+            current_filter_connectables = connectables_by_filter[filter_key] = {}
+
+        for signal in command.get("signals", ()):
+            if "suggestedMetric" in signal and "id" in signal:
+                current_filter_connectables[signal["id"]] = signal["suggestedMetric"]
+
+    # Process signal groups
+    # These are mapped to the "NO_FILTER_APPLICABLE" key as they are assumed to lack specific filters.
+    if "signalGroups" in signalset_data:
+        current_sg_connectables = connectables_by_filter.setdefault("NO_FILTER_APPLICABLE", {})
+
+        for group in signalset_data["signalGroups"]:
+            if "suggestedMetricGroup" in group and "id" in group:
+                current_sg_connectables[group["id"]] = group["suggestedMetricGroup"]
+
+    return connectables_by_filter
+
+
+# Regex pattern to match YYYY-YYYY.json (where YYYY is a 4-digit year)
+YEAR_RANGE_PATTERN = re.compile(r'^\d{4}-\d{4}\.json$', re.IGNORECASE)
+
+
+def is_signalset_file_name(name: str) -> bool:
+    """Whether a file name is default.json or YYYY-YYYY.json."""
+    # Only names of the right length can be a year range, so most skip the regex
+    if len(name) == 14 and YEAR_RANGE_PATTERN.match(name):
+        return True
+    return len(name) == 12 and name.lower() == 'default.json'
+
+
+def iter_signalset_files(directory_path: str) -> Iterator[str]:
+    """
+    Yield the path of every signalset file under a directory.
+
+    Walks the tree top-down like os.walk, yielding a directory's files before
+    descending into its subdirectories and not following directory symlinks,
+    but uses the file type os.scandir already read rather than a stat per entry.
+    Directories that can't be read are skipped.
+    """
+    try:
+        with os.scandir(directory_path) as entries:
+            subdirectories = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if not entry.is_symlink():
+                        subdirectories.append(entry.path)
+                elif is_signalset_file_name(entry.name):
+                    yield entry.path
+    except OSError:
+        return
+
+    for subdirectory in subdirectories:
+        yield from iter_signalset_files(subdirectory)
+
+
+def _process_file(file_path: str, directory_path: str) -> Tuple[str, Optional[Dict[str, Dict[str, str]]], List[Tuple[int, str]]]:
+    """
+    Extract the connectables from one signalset file.
 
-        key_parts = []
-        to_year = filter_data.get('to')
-        from_year = filter_data.get('from')
-        years = filter_data.get('years')  # Expected to be a list from JSON
+    Runs in a worker process, so rather than logging its progress it returns
+    the messages, with their logging levels, for the caller to log in file order.
 
-        if to_year is not None:
-            key_parts.append(f"<={to_year}")
+    Returns:
+        The file's relative path, its connectables (None if there are none to
+        include) and the (level, message) pairs to log for it.
+    """
+    root = os.path.dirname(file_path)
 
-        if from_year is not None:
-            key_parts.append(f"{from_year}<=")
+    # Get the relative path to use as the key
+    rel_path = os.path.relpath(file_path, directory_path)
+    messages: List[Tuple[int, str]] = []
 
-        if years and isinstance(years, list):
+    try:
+        # Load and process the signalset
+        try:
+            signalset_content = load_signalset(file_path)
+            signalset_data = json_loads(signalset_content)
+        except Exception:
+            # If the signalset loader fails, try loading as a regular JSON file
+            with open(file_path, 'rb') as f:
+                signalset_data = json_loads(f.read())
+
+        if "commands" not in signalset_data and "signalGroups" not in signalset_data:  # Check for both
+            messages.append((logging.INFO, f"Skipping {file_path}: no commands or signalGroups found"))
+            return rel_path, None, messages
+
+        # Fallback logic (simplified for brevity, assuming it remains relevant)
+        if not signalset_data.get("commands") and not signalset_data.get("signalGroups"):
+            if "-" not in root:  # Assuming root check is still valid
+                return rel_path, None, messages
+            make = extract_make_from_repo_name(file_path)
+            messages.append((logging.INFO, f"Falling back from {file_path} to the make repo: {make}"))
             try:
-                # Ensure years are numbers and sorted for consistent key generation
-                num_years = sorted([int(y) for y in years if y is not None])
-                if num_years:  # Add only if there are valid years after processing
-                    key_parts.append(",".join(map(str, num_years)))
-            except (ValueError, TypeError):
-                # If years contains non-convertible items or is not iterable as expected,
-                # silently skip this part of the key.
-                pass
+                # This fallback path might need adjustment if it also needs to load raw JSON
+                signalset_content = load_signalset(make + '/signalsets/v3/default.json')
+                signalset_data = json_loads(signalset_content)
+            except Exception:
+                with open(file_path, 'rb') as f:  # Fallback to original file if make repo fails
+                    signalset_data = json_loads(f.read())
 
-        if not key_parts:  # Filter object existed but was empty or yielded no valid parts
-            return "ALL"
+        # Extract connectables
+        connectables = extract_connectables(signalset_data)
 
-        return ",".join(key_parts)
+        # Only include files that have connectables
+        if connectables:  # connectables is now Dict[str_filter, Dict[str_signal, str_metric]]
+            # Calculate total connectables for this file based on the new structure
+            num_connectables_in_file = sum(len(v) for v in connectables.values())
+            messages.append((logging.INFO, f"Processed {rel_path}: found {num_connectables_in_file} connectables across {len(connectables)} filter(s)"))
+            return rel_path, connectables, messages
 
-    # Process individual signals in each command
-    if "commands" in signalset_data:
-        for command in signalset_data.get("commands", []):  # Use .get for safety
-            command_filter_data = command.get("filter")
-            filter_key = _generate_filter_key(command_filter_data)
+        messages.append((logging.INFO, f"No connectables found in {rel_path}"))
 
-            if filter_key not in connectables_by_filter:
-                connectables_by_filter[filter_key] = {}
+    except Exception as e:
+        messages.append((logging.ERROR, f"Error processing {rel_path}: {e}"))
 
-            current_filter_connectables = connectables_by_filter[filter_key]
+    return rel_path, None, messages
 
-            if "signals" in command:
-                for signal in command.get("signals", []):  # Use .get for safety
-                    if "suggestedMetric" in signal and "id" in signal:
-                        current_filter_connectables[signal["id"]] = signal["suggestedMetric"]
 
-    # Process signal groups
-    # These are mapped to the "NO_FILTER_APPLICABLE" key as they are assumed to lack specific filters.
-    if "signalGroups" in signalset_data:
-        sg_filter_key = "NO_FILTER_APPLICABLE"
+def iter_connectables(directory_path: str, jobs: Optional[int] = None) -> Iterator[Tuple[str, Dict[str, Dict[str, str]]]]:
+    """
+    Yield the relative path and connectables of each file in a directory that has any.
 
-        if sg_filter_key not in connectables_by_filter:
-            connectables_by_filter[sg_filter_key] = {}
+    Files are yielded in the order they are found, as each is processed, and
+    the progress messages for each file are logged before it is yielded.
 
-        current_sg_connectables = connectables_by_filter[sg_filter_key]
+    Args:
+        directory_path: Path to the directory to scan for JSON files
+        jobs: Number of worker processes to parse files with; None uses one per
+              CPU and 1 processes the files in this process
+    """
+    file_paths = list(iter_signalset_files(directory_path))
+    process_file = partial(_process_file, directory_path=directory_path)
 
-        for group in signalset_data.get("signalGroups", []):  # Use .get for safety
-            if "suggestedMetricGroup" in group and "id" in group:
-                current_sg_connectables[group["id"]] = group["suggestedMetricGroup"]
+    if jobs == 1 or len(file_paths) <= 1:
+        yield from _report(map(process_file, file_paths))
+    else:
+        # Parsing is CPU-bound and independent per file; map() keeps file order
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            yield from _report(executor.map(process_file, file_paths, chunksize=16))
 
-    return connectables_by_filter
 
+def _report(processed: Iterable[Tuple[str, Optional[Dict[str, Dict[str, str]]], List[Tuple[int, str]]]]) -> Iterator[Tuple[str, Dict[str, Dict[str, str]]]]:
+    """Log each processed file's messages, yielding those that have connectables."""
+    for rel_path, connectables, messages in processed:
+        for level, message in messages:
+            logger.log(level, message)
+        if connectables:
+            yield rel_path, connectables
 
-def process_directory(directory_path: str) -> Dict[str, Dict[str, Dict[str, str]]]:
+
+def process_directory(directory_path: str, jobs: Optional[int] = None) -> Dict[str, Dict[str, Dict[str, str]]]:
     """
     Process all JSON files in a directory, extracting connectables from each.
 
     Args:
         directory_path: Path to the directory to scan for JSON files
+        jobs: Number of worker processes to parse files with; None uses one per
+              CPU and 1 processes the files in this process
 
     Returns:
         Dictionary mapping relative file paths to their connectables,
         where connectables are organized by filter keys.
     """
-    results: Dict[str, Dict[str, Dict[str, str]]] = {}
-    base_dir = Path(directory_path)
+    # Every file's results are kept, and the same signal IDs, filter keys and
+    # metrics recur across files, so each distinct string is kept only once
+    return {
+        rel_path: _intern_connectables(connectables)
+        for rel_path, connectables in iter_connectables(directory_path, jobs)
+    }
 
-    # Regex pattern to match YYYY-YYYY.json (where YYYY is a 4-digit year)
-    year_range_pattern = re.compile(r'^\d{4}-\d{4}\.json$', re.IGNORECASE)
 
-    # Walk the directory tree to find all JSON files
-    for root, _, files in os.walk(directory_path):
-        for file in files:
-            # Only include json files that match either default.json or YYYY-YYYY.json
-            if file.lower() == 'default.json' or year_range_pattern.match(file):
-                file_path = os.path.join(root, file)
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
 
-                # Get the relative path to use as the key
-                rel_path = os.path.relpath(file_path, directory_path)
 
-                try:
-                    # Load and process the signalset
-                    try:
-                        signalset_content = load_signalset(file_path)
-                        signalset_data = json.loads(signalset_content)
-                    except Exception:
-                        # If the signalset loader fails, try loading as a regular JSON file
-                        with open(file_path, 'r') as f:
-                            signalset_data = json.load(f)
-
-                    if "commands" not in signalset_data and "signalGroups" not in signalset_data:  # Check for both
-                        print(f"Skipping {file_path}: no commands or signalGroups found")
-                        continue
-
-                    # Fallback logic (simplified for brevity, assuming it remains relevant)
-                    if not signalset_data.get("commands") and not signalset_data.get("signalGroups"):
-                        if "-" not in root:  # Assuming root check is still valid
-                            continue
-                        make = extract_make_from_repo_name(file_path)
-                        print(f"Falling back from {file_path} to the make repo: {make}")
-                        try:
-                            # This fallback path might need adjustment if it also needs to load raw JSON
-                            signalset_content = load_signalset(make + '/signalsets/v3/default.json')
-                            signalset_data = json.loads(signalset_content)
-                        except Exception:
-                            with open(file_path, 'r') as f:  # Fallback to original file if make repo fails
-                                signalset_data = json.load(f)
-
-                    # Extract connectables
-                    connectables = extract_connectables(signalset_data)
-
-                    # Only include files that have connectables
-                    if connectables:  # connectables is now Dict[str_filter, Dict[str_signal, str_metric]]
-                        results[rel_path] = connectables
-                        # Calculate total connectables for this file based on the new structure
-                        num_connectables_in_file = sum(len(v) for v in connectables.values())
-                        print(f"Processed {rel_path}: found {num_connectables_in_file} connectables across {len(connectables)} filter(s)")
-                    else:
-                        print(f"No connectables found in {rel_path}")
-
-                except Exception as e:
-                    print(f"Error processing {rel_path}: {e}")
-
-    return results
+def _intern_connectables(connectables: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+    """A copy of a file's connectables with its strings interned."""
+    return {
+        _intern(filter_key): {_intern(signal_id): _intern(metric) for signal_id, metric in signals.items()}
+        for filter_key, signals in connectables.items()
+    }
+
+
+def write_connectables(entries: Iterable[Tuple[str, Dict[str, Dict[str, str]]]], f: TextIO) -> Tuple[int, int]:
+    """
+    Write connectables to a file as a JSON object, one entry at a time.
+
+    The output is the same as json.dump(dict(entries), f, indent=2), without
+    holding every file's connectables in memory at once.
+
+    Returns:
+        The number of files and the total number of connectables written.
+    """
+    total_files = 0
+    total_connectables = 0
+    for rel_path, connectables in entries:
+        # Indent the entry's lines to sit one level inside the outer object
+        entry = json.dumps(connectables, indent=2).replace('\n', '\n  ')
+        f.write(f"{'{' if total_files == 0 else ','}\n  {json.dumps(rel_path)}: {entry}")
+        total_files += 1
+        total_connectables += sum(len(v) for v in connectables.values())
+    f.write('\n}' if total_files else '{}')
+    return total_files, total_connectables
 
 
 def main():
@@ -193,8 +320,20 @@ def main():
         '--output', '-o',
         help='Output file path. If not specified, a default name will be used based on the input directory'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        help='Number of processes to parse files with. Defaults to one per CPU'
+    )
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Only report the totals and any errors, not the progress of each file'
+    )
 
     args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
 
     # Check if the input path exists and is a directory
     input_path = args.path
@@ -215,15 +354,18 @@ def main():
         output_path = f"{dir_name}_connectables.json"
 
     try:
-        # Process directory of signalset files
-        results = process_directory(input_path)
-
-        # Write the combined results
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        # Process directory of signalset files, writing each file's results as
+        # it is processed; the output only replaces an existing file once complete
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                total_files, total_connectables = write_connectables(
+                    iter_connectables(input_path, jobs=args.jobs), f)
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
-        total_files = len(results)
-        total_connectables = sum(sum(len(v) for v in cv.values()) for cv in results.values())
         print(f"Successfully processed {total_files} JSON files with a total of {total_connectables} connectables")
         print(f"Output saved to {output_path}")
 
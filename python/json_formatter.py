@@ -1,12 +1,20 @@
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 import json
 import sys
+from functools import lru_cache
+from itertools import zip_longest
 from pathlib import Path
 
 # Add the parent directory to the path so we can import modules
 sys.path.insert(0, str(Path(__file__).parent))
 
-from overlapping_signals import check_overlapping_signals, check_overlapping_signals_no_raise
+from overlapping_signals import (
+    OverlapError,
+    check_overlapping_signals,
+    check_overlapping_signals_no_raise,
+    find_overlapping_signals,
+    raise_for_overlapping_signals,
+)
 
 def format_commands(commands: List[Dict[str, Any]]) -> str:
     """Format a list of commands, sorting them by cmd parameter ID and removing duplicates.
@@ -17,20 +25,23 @@ def format_commands(commands: List[Dict[str, Any]]) -> str:
     Returns:
         Formatted string with unique commands sorted and formatted
     """
+    return ''.join(_iter_formatted_commands(commands))
+
+def _iter_formatted_commands(commands: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the formatted commands array one command at a time."""
     # Remove duplicates before sorting
     unique_commands = remove_duplicate_commands(commands)
 
     # Sort commands by their cmd parameter ID
     sorted_commands = sorted(unique_commands, key=get_command_sort_key)
 
-    # Map each command through the formatter and join with commas and newlines
-    formatted_commands = [format_command_json(cmd) for cmd in sorted_commands]
-    commands_str = ',\n'.join(formatted_commands)
-
-    # Return the final formatted string
-    return f"""[
-{commands_str}
-]"""
+    # Map each command through the formatter, separating them with commas and newlines
+    yield '[\n'
+    for i, cmd in enumerate(sorted_commands):
+        if i:
+            yield ',\n'
+        yield format_command_json(cmd)
+    yield '\n]'
 
 def get_command_sort_key(cmd: Dict[str, Any]) -> tuple:
     """Create a sort key for a command based on hdr, rax, and cmd parameters.
@@ -79,10 +90,23 @@ def get_command_signature(cmd: Dict[str, Any]) -> tuple:
     return (
         cmd.get('hdr'),
         cmd.get('rax'),
-        json.dumps(cmd.get('cmd')),     # Convert dict to stable string representation
-        json.dumps(cmd.get('filter'))   # Convert dict to stable string representation
+        _freeze(cmd.get('cmd')),     # Convert dict to a hashable representation
+        _freeze(cmd.get('filter'))   # Convert dict to a hashable representation
     )
 
+def _freeze(value: Any) -> tuple:
+    """Convert a parsed JSON value to a hashable tuple, without serializing it.
+
+    Two values freeze equal when their json.dumps output would match: dict key
+    order is kept, and containers and scalars are tagged with their type so that
+    e.g. 1 and true, or an object and a list of pairs, stay distinct.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple([(key, _freeze(item)) for key, item in value.items()]))
+    if isinstance(value, list):
+        return (list, tuple([_freeze(item) for item in value]))
+    return (type(value), value)
+
 def remove_duplicate_commands(commands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Remove duplicate commands based on their full configuration (excluding signals).
 
@@ -92,16 +116,12 @@ def remove_duplicate_commands(commands: List[Dict[str, Any]]) -> List[Dict[str,
     Returns:
         List of commands with duplicates removed, keeping the first occurrence
     """
-    seen_signatures = set()
-    unique_commands = []
-
+    # Keyed by signature; setdefault keeps the first command with each one, in order
+    unique_commands = {}
     for cmd in commands:
-        signature = get_command_signature(cmd)
-        if signature not in seen_signatures:
-            seen_signatures.add(signature)
-            unique_commands.append(cmd)
+        unique_commands.setdefault(get_command_signature(cmd), cmd)
 
-    return unique_commands
+    return list(unique_commands.values())
 
 def format_filter_json(filter_obj: Dict[str, Any]) -> str:
     """Format a filter object into a single line JSON string.
@@ -112,6 +132,34 @@ def format_filter_json(filter_obj: Dict[str, Any]) -> str:
     Returns:
         Formatted JSON string for the filter object
     """
+    # Commands share a handful of distinct filters, so each is formatted once.
+    # Values are tagged with their type where equal values format differently,
+    # e.g. 2018 and 2018.0.
+    years_val = filter_obj.get("years")
+    try:
+        return _format_filter_values(
+            "from" in filter_obj, filter_obj.get("from"),
+            "to" in filter_obj, filter_obj.get("to"),
+            tuple([(type(year), year) for year in years_val]) if years_val else None
+        )
+    except TypeError:
+        # Malformed values that can't be hashed are formatted without the cache
+        return _format_filter_obj(filter_obj)
+
+@lru_cache(maxsize=1024, typed=True)
+def _format_filter_values(has_from: bool, from_val: Any, has_to: bool, to_val: Any,
+                          years: Optional[Tuple[Tuple[type, Any], ...]]) -> str:
+    """Format the filter with the given fields; the cached part of format_filter_json."""
+    filter_obj = {}
+    if has_from:
+        filter_obj["from"] = from_val
+    if has_to:
+        filter_obj["to"] = to_val
+    if years is not None:
+        filter_obj["years"] = [year for _, year in years]
+    return _format_filter_obj(filter_obj)
+
+def _format_filter_obj(filter_obj: Dict[str, Any]) -> str:
     parts = []
 
     # Get values for ordering logic
@@ -120,7 +168,7 @@ def format_filter_json(filter_obj: Dict[str, Any]) -> str:
     years_val = filter_obj.get("years", [])
 
     # Sort years for consistent output
-    sorted_years = sorted(list(years_val)) if years_val else []
+    sorted_years = sorted(years_val) if years_val else []
     max_year = max(sorted_years) if sorted_years else None
 
     # Determine if from should be placed after to and/or years
@@ -215,7 +263,8 @@ def format_command_json(command: Dict[str, Any]) -> str:
         else:
             scaling_signals.append(signal)
 
-    # Build the signals section
+    # Build the signals section. Entries may span several lines; they are indented
+    # as whole blocks rather than split into lines and rejoined.
     signals_lines = ['  "signals": [']
 
     # Format scaling signals (if any) using tabularization
@@ -223,7 +272,7 @@ def format_command_json(command: Dict[str, Any]) -> str:
         signal_parts = [format_scaling_signal_json(signal) for signal in scaling_signals]
         tabularized = tabularize(signal_parts)
         if tabularized:
-            signals_lines.extend(['    ' + line for line in tabularized.split('\n')])
+            signals_lines.append('    ' + tabularized.replace('\n', '\n    '))
 
     # Add enumeration signals (if any)
     if enum_signals:
@@ -239,7 +288,7 @@ def format_command_json(command: Dict[str, Any]) -> str:
             if i < len(enum_signals) - 1:
                 enum_lines[-1] += ','
 
-            signals_lines.extend(['    ' + line for line in enum_lines])
+            signals_lines.append('    ' + '\n    '.join(enum_lines))
 
     signals_lines.append('  ]')
 
@@ -546,14 +595,6 @@ def _format_scaling(fmt: dict) -> list[str]:
 
     return keys
 
-def format_number(n: float) -> str:
-    """Format a number without trailing zeros after decimal point."""
-    # Convert to string with high precision
-    s = f"{n:.10f}"
-    # Remove trailing zeros and decimal point if whole number
-    s = s.rstrip('0').rstrip('.')
-    return s
-
 def format_signal_groups(groups: List[Dict[str, Any]]) -> str:
     """Format signal groups in a human-friendly way.
 
@@ -611,6 +652,10 @@ def format_signal_groups(groups: List[Dict[str, Any]]) -> str:
 
 def format_number(n: float) -> str:
     """Format a number without trailing zeros after decimal point."""
+    # Most numbers in signal sets are integers, which format the same way directly
+    # (bools are ints too, but format as 1 and 0, so they take the general path)
+    if type(n) is int:
+        return str(n)
     # Convert to string with high precision
     s = f"{n:.10f}"
     # Remove trailing zeros and decimal point if whole number
@@ -641,67 +686,62 @@ def tabularize(rows: list[list[str]]) -> str:
     Returns:
         String with aligned columns, rows separated by commas and newlines
     """
-    # Calculate maximum length for each column
-    max_lengths = {}
-    for row in rows:
-        for index, column in enumerate(row):
-            max_lengths[index] = max(max_lengths.get(index, 0), len(column))
+    # Calculate maximum length for each column, over the rows long enough to have it
+    max_lengths = [max(map(len, column)) for column in zip_longest(*rows, fillvalue='')]
 
     # Process each row
     formatted_rows = []
     for row in rows:
-        # Process each column in the row
-        formatted_columns = []
-        for index, column in enumerate(row):
-            max_length = max_lengths.get(index)
-            if max_length and max_length > 0:
-                # Add padding if not the last column
-                if index < len(row) - 1:
-                    padding = ' ' * (max_length - len(column) + 1)
-                    formatted_columns.append(column + padding)
-                else:
-                    formatted_columns.append(column)
-
-        # Join columns for this row
-        formatted_rows.append(''.join(formatted_columns))
+        last_index = len(row) - 1
+        # Pad every column but the last to one past its width; columns that are
+        # empty in every row add nothing, not even the separating space
+        formatted_rows.append(''.join([
+            column.ljust(max_lengths[index] + 1) if index < last_index and max_lengths[index] else column
+            for index, column in enumerate(row)
+        ]))
 
     # Join all rows with comma and newline
     return ',\n'.join(formatted_rows)
 
 def format_json_data(data) -> str:
-    # Start building the formatted output
-    output = []
+    return ''.join(iter_formatted_json(data))
+
+def iter_formatted_json(data) -> Iterator[str]:
+    """Yield the formatted signal set in order, one section or command at a time.
+
+    Joining the chunks gives the same string as format_json_data, but callers
+    that only compare against existing text can stop at the first mismatch.
 
+    Args:
+        data: Parsed signal set JSON
+
+    Returns:
+        Iterator over consecutive pieces of the formatted output
+    """
     # Handle diagnostic level if present
     if 'diagnosticLevel' in data:
-        output.append('{ "diagnosticLevel": "' + data['diagnosticLevel'] + '",')
-        output.append('  "commands": ' + format_commands(data['commands']))
+        yield '{ "diagnosticLevel": "' + data['diagnosticLevel'] + '",\n'
+        yield '  "commands": '
     else:
-        output.append('{ "commands": ' + format_commands(data['commands']))
+        yield '{ "commands": '
+    yield from _iter_formatted_commands(data['commands'])
 
     # Handle signal groups if present
     if 'signalGroups' in data:
-        output[-1] += ','
-        output.append(format_signal_groups(data['signalGroups']))
+        yield ',\n' + format_signal_groups(data['signalGroups'])
 
     # Handle synthetics if present
     if 'synthetics' in data:
-        output[-1] += ','
-        output.append(format_synthetics(data['synthetics']))
+        yield ',\n' + format_synthetics(data['synthetics'])
 
     # Close the JSON object
-    output.append('}')
-
-    # Join all parts with appropriate newlines
-    formatted = '\n'.join(output) + '\n'
-
-    return formatted
+    yield '\n}\n'
 
 def format_file(
     input_path: str,
     output_path: Optional[str] = None,
     return_overlaps: bool = False
-) -> Union[str, Tuple[str, List[Dict[str, Any]]]]:
+) -> Union[str, Tuple[str, List[OverlapError]]]:
     """Format a signal set JSON file in a human-friendly way.
 
     Args:
@@ -711,7 +751,7 @@ def format_file(
 
     Returns:
         If return_overlaps is False: Formatted JSON string
-        If return_overlaps is True: Tuple of (formatted_string, List[overlap_error_dicts])
+        If return_overlaps is True: Tuple of (formatted_string, List[OverlapError])
 
     Raises:
         OverlappingSignalError: If return_overlaps is False and signals have overlapping bit definitions
@@ -727,6 +767,93 @@ def format_file(
         with open(output_path, 'w') as f:
             f.write(formatted)
 
+    return _validate_formatted(formatted, return_overlaps)
+
+def format_string(
+    json_text: str,
+    return_overlaps: bool = False
+) -> Union[str, Tuple[str, List[OverlapError]]]:
+    """Format signal set JSON that has already been read into memory.
+
+    Used by `cli.py`, which reads the input itself and writes any output file
+    before reporting overlapping signals.
+
+    Args:
+        json_text: Signal set JSON document as a string
+        return_overlaps: If True, return tuple of (formatted_string, overlap_errors) instead of raising
+
+    Returns:
+        If return_overlaps is False: Formatted JSON string
+        If return_overlaps is True: Tuple of (formatted_string, List[OverlapError])
+
+    Raises:
+        OverlappingSignalError: If return_overlaps is False and signals have overlapping bit definitions
+    """
+    formatted = format_json_data(json.loads(json_text))
+    return _validate_formatted(formatted, return_overlaps)
+
+def is_canonical(
+    json_text: Union[str, bytes],
+    return_overlaps: bool = False
+) -> Union[bool, Tuple[bool, List[OverlapError]]]:
+    """Check whether signal set JSON is already formatted, ignoring surrounding whitespace.
+
+    The formatted output is compared against the input in place as it is
+    produced, so a mismatch is reported without building the rest of the
+    formatted document or copying the input. Overlapping signals are only
+    checked when the input is canonical, in which case the input is the
+    formatted output.
+
+    Args:
+        json_text: Signal set JSON document, either decoded or as raw UTF-8 bytes
+        return_overlaps: If True, return tuple of (is_canonical, overlap_errors) instead of raising
+
+    Returns:
+        If return_overlaps is False: True if the input is canonically formatted
+        If return_overlaps is True: Tuple of (is_canonical, List[OverlapError])
+
+    Raises:
+        OverlappingSignalError: If return_overlaps is False and signals have overlapping bit definitions
+    """
+    data = json.loads(json_text)
+    as_bytes = isinstance(json_text, bytes)
+
+    # Bounds of the input without surrounding whitespace
+    start, end = 0, len(json_text)
+    while start < end and json_text[start:start + 1].isspace():
+        start += 1
+    while end > start and json_text[end - 1:end].isspace():
+        end -= 1
+
+    # Formatted output never starts with whitespace and always ends with a single
+    # newline, so it must equal the stripped input plus that newline
+    offset = start
+    for chunk in iter_formatted_json(data):
+        if as_bytes:
+            chunk = chunk.encode()
+        stop = offset + len(chunk)
+        if stop > end:
+            # Only the closing newline may run past the stripped input
+            if stop != end + 1 or not json_text.startswith(chunk[:-1], offset, end):
+                return (False, []) if return_overlaps else False
+        elif not json_text.startswith(chunk, offset, end):
+            return (False, []) if return_overlaps else False
+        offset = stop
+
+    if offset != end + 1:
+        return (False, []) if return_overlaps else False
+
+    overlaps = find_overlapping_signals(data)
+    if return_overlaps:
+        return True, overlaps
+    raise_for_overlapping_signals(overlaps)
+    return True
+
+def _validate_formatted(
+    formatted: str,
+    return_overlaps: bool
+) -> Union[str, Tuple[str, List[OverlapError]]]:
+    """Check formatted output for overlapping signals and shape the return value."""
     # Validate no overlapping signals after formatting (in case formatting merged commands)
     if return_overlaps:
         overlaps = check_overlapping_signals_no_raise(formatted)
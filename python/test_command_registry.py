@@ -263,5 +263,231 @@ def test_signed_value_decoding():
     assert len(responses) == 1
     assert pytest.approx(responses[0].values["STEERING_ANGLE"]) == -45.5
 
+def test_most_recent_command_takes_priority():
+    """Test that the last-registered command wins when several match the same response."""
+    first = create_test_command(
+        pid=0x0101,
+        service_type=ServiceType.SERVICE_22,
+        receive_address="7EC",
+        signals=[create_test_signal("FIRST", "First", {"bit_length": 8, "max_value": 255, "unit": "scalar"})]
+    )
+    second = create_test_command(
+        pid=0x0101,
+        service_type=ServiceType.SERVICE_22,
+        receive_address="7EC",
+        signals=[create_test_signal("SECOND", "Second", {"bit_length": 8, "max_value": 255, "unit": "scalar"})]
+    )
+    registry = CommandRegistry([first, second])
+
+    packet = CANPacket(
+        can_identifier="7EC",
+        extended_receive_address=None,
+        data=bytes.fromhex("6201010A")
+    )
+    responses = registry.identify_commands(packet)
+
+    assert [response.command for response in responses] == [second]
+    assert responses[0].values == {"SECOND": 10}
+
+    # No command is bound to another ECU, and there is no generic fallback
+    other_packet = CANPacket(
+        can_identifier="7ED",
+        extended_receive_address=None,
+        data=bytes.fromhex("6201010A")
+    )
+    assert registry.identify_commands(other_packet) == []
+
+def test_cached_signalset_is_loaded_once(monkeypatch):
+    """Test that signal definitions are only read and parsed once per process."""
+    from can import command_registry
+
+    loads = []
+    def fake_load(url, cache_name, signal_type):
+        loads.append(cache_name)
+        return ['command']
+
+    monkeypatch.setattr(command_registry, 'SIGNALSET_MEMORY_CACHE', {})
+    monkeypatch.setattr(command_registry, '_read_or_fetch_signalset', fake_load)
+
+    first = command_registry.get_cached_signalset('https://example.invalid', 'example')
+    second = command_registry.get_cached_signalset('https://example.invalid', 'example')
+
+    assert first is second
+    assert loads == ['example']
+
+def test_truncated_response_skips_signals_past_the_data(caplog):
+    """Test that signals beyond a truncated response are reported while the rest still decode."""
+    command = create_test_command(
+        pid=0x0101,
+        service_type=ServiceType.SERVICE_22,
+        receive_address="7EC",
+        signals=[
+            create_test_signal("PRESENT", "Present", {"bit_length": 8, "max_value": 255, "unit": "scalar"}),
+            create_test_signal("MISSING", "Missing", {"bit_length": 8, "bit_offset": 8, "max_value": 255, "unit": "scalar"}),
+        ]
+    )
+    registry = CommandRegistry([command])
+
+    packet = CANPacket(
+        can_identifier="7EC",
+        extended_receive_address=None,
+        data=bytes.fromhex("6201010A")
+    )
+    responses = registry.identify_commands(packet)
+
+    assert responses[0].values == {"PRESENT": 10}
+    assert "Error decoding signal MISSING: Not enough data: need 16 bits, have 8" in caplog.text
+
+def test_cached_signalset_is_pickled(tmp_path, monkeypatch):
+    """Test that a cached signalset is parsed once and then loaded from its pickle."""
+    import json
+    import os
+    from can import command_registry
+
+    monkeypatch.setattr(command_registry, 'CACHE_DIR', tmp_path)
+    cache_file = tmp_path / 'example.json'
+    cache_file.write_text(json.dumps({'commands': [{
+        'hdr': '7E0', 'rax': '7E8', 'cmd': {'22': '1234'}, 'freq': 1,
+        'signals': [{'id': 'EXAMPLE', 'name': 'Example', 'fmt': {'len': 8, 'max': 255, 'unit': 'scalar'}}]
+    }]}))
+
+    parsed = command_registry._read_or_fetch_signalset('https://example.invalid', 'example', 'generic')
+    pickle_file = tmp_path / 'example.generic.pickle'
+    assert pickle_file.exists()
+
+    # The pickle is preferred while it is newer than the JSON...
+    monkeypatch.setattr(command_registry, '_parse_commands', lambda *args: pytest.fail('reparsed'))
+    assert command_registry._read_or_fetch_signalset('https://example.invalid', 'example', 'generic') == parsed
+
+    # ...and ignored once the JSON is rewritten
+    stat = pickle_file.stat()
+    os.utime(pickle_file, ns=(stat.st_atime_ns, cache_file.stat().st_mtime_ns - 1))
+    with pytest.raises(pytest.fail.Exception):
+        command_registry._load_cached_commands(cache_file, 'generic')
+
+def test_unreadable_pickle_falls_back_to_json(tmp_path, monkeypatch):
+    """Test that a pickle which can no longer be loaded is replaced by a fresh parse."""
+    import json
+    import pickle
+    from can import command_registry
+
+    monkeypatch.setattr(command_registry, 'CACHE_DIR', tmp_path)
+    cache_file = tmp_path / 'example.json'
+    cache_file.write_text(json.dumps({'commands': [{
+        'hdr': '7E0', 'rax': '7E8', 'cmd': {'22': '1234'}, 'freq': 1,
+        'signals': [{'id': 'EXAMPLE', 'name': 'Example', 'fmt': {'len': 8, 'max': 255, 'unit': 'scalar'}}]
+    }]}))
+    # Pickled with a class that has since been removed, so loading raises ImportError
+    pickle_file = tmp_path / 'example.generic.pickle'
+    pickle_file.write_bytes(b"cremoved_module\nRemovedClass\n.")
+
+    commands = command_registry._load_cached_commands(cache_file, 'generic')
+
+    assert [command.signals[0].id for command in commands] == ['EXAMPLE']
+    with open(pickle_file, 'rb') as f:
+        assert pickle.load(f) == commands
+
+def test_stale_signalset_is_revalidated_with_etag(tmp_path, monkeypatch):
+    """Test that an expired cache is kept when the server reports it unchanged."""
+    import os
+    import urllib.error
+    from can import command_registry
+
+    monkeypatch.setattr(command_registry, 'CACHE_DIR', tmp_path)
+    cache_file = tmp_path / 'example.json'
+    cache_file.write_text('{"commands": []}')
+    (tmp_path / 'example.etag').write_text('"abc"')
+    expired = cache_file.stat().st_mtime - command_registry.CACHE_MAX_AGE - 1
+    os.utime(cache_file, (expired, expired))
+
+    requests = []
+    def fake_urlopen(request):
+        requests.append(request)
+        raise urllib.error.HTTPError(request.full_url, 304, 'Not Modified', {}, None)
+    monkeypatch.setattr(command_registry.urllib.request, 'urlopen', fake_urlopen)
+
+    assert command_registry._read_or_fetch_signalset('https://example.invalid', 'example', 'generic') == []
+    assert requests[0].get_header('If-none-match') == '"abc"'
+    # The cache is fresh again, so the next load doesn't go to the network
+    assert cache_file.stat().st_mtime > expired + 1
+
+def test_corrupt_signalset_is_fetched_again_despite_etag(tmp_path, monkeypatch):
+    """Test that a truncated cache isn't revalidated by its stored ETag but downloaded again."""
+    import io
+    import os
+    import urllib.error
+    from can import command_registry
+
+    monkeypatch.setattr(command_registry, 'CACHE_DIR', tmp_path)
+    cache_file = tmp_path / 'example.json'
+    cache_file.write_text('{"commands": [')
+    etag_file = tmp_path / 'example.etag'
+    etag_file.write_text('"abc"')
+    expired = cache_file.stat().st_mtime - command_registry.CACHE_MAX_AGE - 1
+    os.utime(cache_file, (expired, expired))
+
+    class FakeResponse(io.BytesIO):
+        headers = {'ETag': '"def"'}
+
+    requests = []
+    def fake_urlopen(request):
+        requests.append(request)
+        if request.get_header('If-none-match') == '"abc"':
+            raise urllib.error.HTTPError(request.full_url, 304, 'Not Modified', {}, None)
+        return FakeResponse(b'{"commands": []}')
+    monkeypatch.setattr(command_registry.urllib.request, 'urlopen', fake_urlopen)
+
+    assert command_registry._read_or_fetch_signalset('https://example.invalid', 'example', 'generic') == []
+    assert [request.get_header('If-none-match') for request in requests] == ['"abc"', None]
+    assert cache_file.read_text() == '{"commands": []}'
+    assert etag_file.read_text() == '"def"'
+
+def test_command_signal_by_id():
+    """Test looking up a command's signals by ID."""
+    signals = [
+        create_test_signal("FIRST", "First", {"bit_length": 8, "max_value": 255, "unit": "scalar"}),
+        create_test_signal("SECOND", "Second", {"bit_length": 8, "bit_offset": 8, "max_value": 255, "unit": "scalar"}),
+    ]
+    command = create_test_command(pid=0x0101, service_type=ServiceType.SERVICE_22, receive_address=None, signals=signals)
+
+    assert command.signal_by_id("SECOND") is signals[1]
+    assert command.signal_by_id("MISSING") is None
+
+
+def test_signalset_registry_is_reused_until_released(monkeypatch):
+    """Test that a signal set's registry is reused and dropped once the signal set is released."""
+    import gc
+    from can import command_registry
+    from can.signals import SignalSet
+
+    base_commands = [create_test_command(pid=0x0D, service_type=ServiceType.SERVICE_01, receive_address="7E8", signals=[])]
+    monkeypatch.setattr(command_registry, 'get_cached_saej1979_signals', lambda: base_commands)
+    monkeypatch.setattr(command_registry, '_REGISTRY_BY_SIGNALSET', {})
+
+    signalset = SignalSet(commands={create_test_command(pid=0x0101, service_type=ServiceType.SERVICE_22, receive_address="7EC", signals=[])})
+    registry = command_registry._registry_for_signalset(signalset)
+    assert command_registry._registry_for_signalset(signalset) is registry
+    assert len(command_registry._REGISTRY_BY_SIGNALSET) == 1
+
+    del signalset
+    gc.collect()
+    assert command_registry._REGISTRY_BY_SIGNALSET == {}
+
+def test_signalset_registry_is_rebuilt_when_base_commands_reload(monkeypatch):
+    """Test that a signal set's registry picks up reloaded SAE J1979 commands."""
+    from can import command_registry
+    from can.signals import SignalSet
+
+    base_commands = [[create_test_command(pid=0x0D, service_type=ServiceType.SERVICE_01, receive_address="7E8", signals=[])]]
+    monkeypatch.setattr(command_registry, 'get_cached_saej1979_signals', lambda: base_commands[0])
+    monkeypatch.setattr(command_registry, '_REGISTRY_BY_SIGNALSET', {})
+
+    signalset = SignalSet(commands={create_test_command(pid=0x0101, service_type=ServiceType.SERVICE_22, receive_address="7EC", signals=[])})
+    registry = command_registry._registry_for_signalset(signalset)
+
+    base_commands[0] = list(base_commands[0])
+    assert command_registry._registry_for_signalset(signalset) is not registry
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
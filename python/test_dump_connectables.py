@@ -0,0 +1,126 @@
+import io
+import json
+import logging
+import os
+import re
+
+import pytest
+
+from .dump_connectables import extract_connectables, iter_signalset_files, process_directory, write_connectables
+
+
+def _touch(path, content='{}'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+def test_iter_signalset_files_matches_os_walk(tmp_path):
+    for rel_path in [
+        'default.json',
+        'notes.json',
+        'Make-Model/signalsets/v3/default.json',
+        'Make-Model/signalsets/v3/2019-2021.json',
+        'Make-Model/signalsets/v3/2019-2021.json.bak',
+        'Make-Model/signalsets/v3/DEFAULT.JSON',
+        'Other/tests/2010-2012.json',
+    ]:
+        _touch(os.path.join(tmp_path, rel_path))
+
+    expected = []
+    for root, _, files in os.walk(tmp_path):
+        for file in files:
+            if file.lower() == 'default.json' or re.match(r'^\d{4}-\d{4}\.json$', file, re.IGNORECASE):
+                expected.append(os.path.join(root, file))
+
+    found = list(iter_signalset_files(str(tmp_path)))
+    assert sorted(found) == sorted(expected)
+    assert len(found) == 5
+
+
+def test_iter_signalset_files_skips_symlinked_directories(tmp_path):
+    _touch(os.path.join(tmp_path, 'real', 'default.json'))
+    os.symlink(os.path.join(tmp_path, 'real'), os.path.join(tmp_path, 'link'))
+
+    assert list(iter_signalset_files(str(tmp_path))) == [os.path.join(tmp_path, 'real', 'default.json')]
+
+
+def test_process_directory_in_parallel_matches_serial(tmp_path):
+    for year in range(2000, 2040, 2):
+        signalset = {"commands": [{
+            "filter": {"from": year},
+            "signals": [{"id": f"SIG_{year}", "suggestedMetric": "speed"}, {"id": "OTHER"}],
+        }]}
+        _touch(os.path.join(tmp_path, 'Make-Model', f"{year}-{year + 1}.json"), json.dumps(signalset))
+    _touch(os.path.join(tmp_path, 'Make-Model', 'default.json'), 'not json')
+
+    serial = process_directory(str(tmp_path), jobs=1)
+    parallel = process_directory(str(tmp_path), jobs=2)
+
+    assert parallel == serial
+    assert list(parallel) == list(serial)
+    assert len(serial) == 20
+    assert serial[os.path.join('Make-Model', '2010-2011.json')] == {"2010<=": {"SIG_2010": "speed"}}
+
+
+@pytest.mark.parametrize("results", [
+    {},
+    {"a/default.json": {"ALL": {}}},
+    {
+        "Make-Model/default.json": {"ALL": {"SPEED": "speed"}, "2019<=": {"SOC": "stateOfCharge", "ODO": "odometer"}},
+        "Make-Model/2010-2012.json": {"NO_FILTER_APPLICABLE": {"GRP": "locatïon"}},
+    },
+])
+def test_write_connectables_matches_json_dump(results):
+    output = io.StringIO()
+    total_files, total_connectables = write_connectables(results.items(), output)
+
+    assert output.getvalue() == json.dumps(results, indent=2)
+    assert total_files == len(results)
+    assert total_connectables == sum(sum(len(v) for v in cv.values()) for cv in results.values())
+
+
+def test_extract_connectables_filter_keys():
+    def command(filter_data, signal_id):
+        return {"filter": filter_data, "signals": [{"id": signal_id, "suggestedMetric": "speed"}]}
+
+    connectables = extract_connectables({"commands": [
+        command(None, "A"),
+        command({"to": 2020}, "B"),
+        command({"to": 2020}, "C"),
+        command({"from": 2018, "years": [2016, "2015"]}, "D"),
+        command({"years": ["bad"]}, "E"),
+        command({"to": [2020]}, "F"),
+    ]})
+
+    assert connectables == {
+        "ALL": {"A": "speed", "E": "speed"},
+        "<=2020": {"B": "speed", "C": "speed"},
+        "2018<=,2015,2016": {"D": "speed"},
+        "<=[2020]": {"F": "speed"},
+    }
+
+
+def test_process_directory_shares_repeated_strings(tmp_path):
+    for name in ('2010-2011.json', '2012-2013.json'):
+        signalset = {"commands": [{"signals": [{"id": "SPEED", "suggestedMetric": "speed"}]}]}
+        _touch(os.path.join(tmp_path, 'Make-Model', name), json.dumps(signalset))
+
+    first, second = process_directory(str(tmp_path), jobs=2).values()
+
+    (first_id, first_metric), = first["ALL"].items()
+    (second_id, second_metric), = second["ALL"].items()
+    assert first_id is second_id
+    assert first_metric is second_metric
+
+
+def test_process_directory_logs_errors_above_progress(tmp_path, caplog):
+    _touch(os.path.join(tmp_path, 'Make-Model', 'default.json'), 'not json')
+    signalset = {"commands": [{"signals": [{"id": "SPEED", "suggestedMetric": "speed"}]}]}
+    _touch(os.path.join(tmp_path, 'Make-Model', '2010-2011.json'), json.dumps(signalset))
+
+    with caplog.at_level(logging.WARNING):
+        process_directory(str(tmp_path), jobs=1)
+
+    assert [record.levelno for record in caplog.records] == [logging.ERROR]
+    assert "Error processing" in caplog.records[0].getMessage()
@@ -9,7 +9,10 @@ from .json_formatter import (
     format_filter_json,
     format_json_data,
     format_number,
-    format_parameter_json
+    format_parameter_json,
+    format_string,
+    get_command_signature,
+    is_canonical
 )
 
 REPO_ROOT = os.path.abspath(os.path.dirname(__file__))
@@ -30,6 +33,19 @@ def test_empty_input():
     assert tabularize([]) == ''
     assert tabularize([[]]) == ''
 
+def test_ragged_rows_and_empty_columns():
+    rows = [
+        ['{"a": 1,', '', '"b": 2}'],
+        ['{"a": 100,', ''],
+        ['{"a": 1}'],
+    ]
+    expected = (
+        '{"a": 1,   "b": 2}',
+        '{"a": 100, ',
+        '{"a": 1}'
+    )
+    assert tabularize(rows) == ',\n'.join(expected)
+
 def test_single_row():
     rows = [['{"id": "signal1",', '"path": "path1",', '"name": "name1"}']]
     expected = '{"id": "signal1", "path": "path1", "name": "name1"}'
@@ -77,6 +93,9 @@ def test_format_number():
     assert format_number(123.45600) == "123.456"
     assert format_number(0.0) == "0"
     assert format_number(-123.456) == "-123.456"
+    assert format_number(-40) == "-40"
+    assert format_number(True) == "1"
+    assert format_number(2 ** 70) == str(2 ** 70)
 
 def test_format_parameter_json():
     # Test Service 21 parameter
@@ -210,6 +229,50 @@ def test_signal_formatting(test_file):
     with open(signalset_path) as f:
         assert f.read() == formatted
 
+def test_format_string_matches_format_file():
+    """Test that formatting in-memory JSON matches formatting the file on disk."""
+    signalset_path = os.path.join(REPO_ROOT, 'testdata', 'ford-f-150.json')
+    with open(signalset_path) as f:
+        contents = f.read()
+
+    formatted, overlaps = format_string(contents, return_overlaps=True)
+
+    assert formatted == format_file(signalset_path)
+    assert overlaps == []
+
+def test_is_canonical():
+    """Test that canonical input is accepted and any divergence is rejected."""
+    signalset_path = os.path.join(REPO_ROOT, 'testdata', 'ford-f-150.json')
+    with open(signalset_path) as f:
+        contents = f.read()
+
+    assert is_canonical(contents) is True
+    assert is_canonical('\n' + contents + '\n\n') is True
+    assert is_canonical(contents.replace('"freq": ', '"freq":  ', 1)) is False
+    assert is_canonical(json.dumps(json.loads(contents))) is False
+    assert is_canonical(contents.rstrip('\n')) is True
+
+def test_is_canonical_accepts_bytes():
+    """Test that raw file bytes are checked the same way as decoded text."""
+    signalset_path = os.path.join(REPO_ROOT, 'testdata', 'porsche-taycan.json')
+    with open(signalset_path, 'rb') as f:
+        contents = f.read()
+
+    assert is_canonical(contents) is True
+    assert is_canonical(b'  ' + contents + b'\n') is True
+    assert is_canonical(contents.replace(b'"freq": ', b'"freq":  ', 1)) is False
+
+def test_is_canonical_reports_overlaps():
+    """Test that overlapping signals are reported for canonical input."""
+    bad_file = os.path.join(REPO_ROOT, 'testdata', 'bad-overlappingsignals.json')
+    formatted, expected_overlaps = format_file(bad_file, return_overlaps=True)
+
+    canonical, overlaps = is_canonical(formatted, return_overlaps=True)
+
+    assert canonical is True
+    assert overlaps == expected_overlaps
+    assert len(overlaps) > 0
+
 def test_format_command_signals_sorted_by_bix():
     """Test that signals are sorted by their bix value with default of 0 when not provided."""
     command_with_mixed_bix = {
@@ -380,5 +443,23 @@ def test_format_filter_json():
     assert result15 == '{  }'
 
 
+@pytest.mark.parametrize("first, second", [
+    ({"cmd": {"22": "F40D"}}, {"cmd": {"22": "F40D"}}),
+    ({"cmd": {"22": "F40D"}, "filter": {"from": 2018, "years": [2015]}},
+     {"cmd": {"22": "F40D"}, "filter": {"from": 2018, "years": [2015]}}),
+    ({"cmd": {"22": "F40D"}, "filter": {"from": 2018, "to": 2020}},
+     {"cmd": {"22": "F40D"}, "filter": {"to": 2020, "from": 2018}}),
+    ({"cmd": {"22": "F40D"}, "filter": {"from": 1}}, {"cmd": {"22": "F40D"}, "filter": {"from": True}}),
+    ({"cmd": {"22": "F40D"}, "filter": {"years": [2018]}}, {"cmd": {"22": "F40D"}, "filter": {"years": 2018}}),
+    ({"cmd": {"22": "F40D"}}, {"cmd": [["22", "F40D"]]}),
+])
+def test_command_signature_matches_json_dumps(first, second):
+    def json_signature(cmd):
+        return (cmd.get('hdr'), cmd.get('rax'), json.dumps(cmd.get('cmd')), json.dumps(cmd.get('filter')))
+
+    same = get_command_signature(first) == get_command_signature(second)
+    assert same == (json_signature(first) == json_signature(second))
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
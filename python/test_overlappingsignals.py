@@ -3,7 +3,12 @@ import pytest
 from pathlib import Path
 
 from json_formatter import format_file
-from signals_testing import check_overlapping_signals, OverlappingSignalError
+from signals_testing import (
+    check_overlapping_signals,
+    check_overlapping_signals_no_raise,
+    OverlapError,
+    OverlappingSignalError,
+)
 
 TESTDATA_DIR = os.path.join(Path(__file__).parent, 'testdata')
 
@@ -68,3 +73,24 @@ def test_overlapping_signals_with_implicit_bix():
     error_message = str(exc_info.value)
     assert "SIG_B" in error_message
     assert "SIG_A" in error_message
+
+
+def test_overlap_errors_are_structured():
+    """Test that overlap errors expose the conflicting signals and bit as fields."""
+    signalset_json = '''{
+        "commands": [{
+            "hdr": "720", "rax": "728", "cmd": {"22": "404C"}, "freq": 5,
+            "signals": [
+                {"id": "SIG_A", "fmt": {"bix": 0, "len": 8}},
+                {"id": "SIG_B", "fmt": {"bix": 4, "len": 8}}
+            ]
+        }]
+    }'''
+    errors = check_overlapping_signals_no_raise(signalset_json)
+
+    assert errors == [OverlapError(
+        signal_id="SIG_B",
+        conflicting_signal_id="SIG_A",
+        bit=4,
+        command="hdr=720, cmd={'22': '404C'}"
+    )]
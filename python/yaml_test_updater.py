@@ -172,10 +172,6 @@ def process_yaml_file(yaml_path: str, model_year: int, dry_run: bool = False, ve
                 can_id_format=can_format,
                 extended_addressing_enabled=ext_addr
             )
-            if not scanner:
-                if verbose:
-                    print(f"  Warning: Could not parse response in test case {test_idx+1}")
-                continue
 
             # Process the response with current signalset
             current_values = {}